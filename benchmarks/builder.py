@@ -0,0 +1,73 @@
+"""Round trip latency and throughput of client.builder() against the stub server.
+
+Every call is encrypted, signed, sent over http, decrypted and wrapped in
+Results, the latency run sends one call at a time, the throughput run
+keeps --concurrency calls in flight, e.g.
+
+    python benchmarks/builder.py --calls 2000 --concurrency 64
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from pyshad.crypto import Crypto
+
+from stub_server import StubServer, connect_client
+
+
+def percentile(values: list, fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def main(args):
+    server = StubServer(Crypto.secret(32))
+    await server.start()
+    # the cache and rate limiter would measure themselves, not the pipeline
+    client = await connect_client(server, cache=False, rate_limiter=False)
+    input = {'object_guid': 'u0stub', 'text': 'x' * args.size}
+    try:
+        for _ in range(args.warmup):
+            await client.builder(args.method, input=input)
+
+        latencies = []
+        for _ in range(args.calls):
+            start = time.perf_counter()
+            await client.builder(args.method, input=input)
+            latencies.append(time.perf_counter() - start)
+
+        queue = iter(range(args.calls))
+
+        async def worker():
+            for _ in queue:
+                await client.builder(args.method, input=input)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(args.concurrency)])
+        elapsed = time.perf_counter() - start
+
+    finally:
+        await client.disconnect()
+        await server.close()
+
+    latencies.sort()
+    print(json.dumps({
+        'benchmark': 'builder',
+        'method': args.method,
+        'calls': args.calls,
+        'concurrency': args.concurrency,
+        'p50_ms': round(statistics.median(latencies) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'calls_per_second': round(args.calls / elapsed, 1),
+    }))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--method', default='sendMessage')
+    parser.add_argument('--size', type=int, default=64, help='length of the sent text')
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,120 @@
+"""Run api calls against the stub server while it injects faults.
+
+Reports, as json, how many calls succeeded, which typed exceptions the
+failures raised and the latency of the calls. Scripted faults then check
+the retry policy, the run exits with status 1 when one of them does not
+end as expected, e.g.
+
+    python benchmarks/faults.py --calls 200 --error-rate 0.2 --drop-rate 0.05
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+from pyshad.crypto import Crypto
+from pyshad.retry import RetryPolicy
+
+from stub_server import FaultInjector, StubServer, connect_client
+
+
+async def call(client, method: str, index: int, outcomes: dict, latencies: list):
+    input = {'user_guid': f'u0{index}'} if method == 'getUserInfo' else {'object_guid': f'u0{index}', 'text': 'hi'}
+    start = time.perf_counter()
+    try:
+        await client.builder(method, input=input)
+        outcome = 'OK'
+
+    except Exception as exc:
+        outcome = type(exc).__name__
+
+    latencies.append(time.perf_counter() - start)
+    outcomes[method][outcome] = outcomes[method].get(outcome, 0) + 1
+
+
+# name, method, faults of the first requests, server delay in seconds, retry deadline,
+# expected outcome and how many requests the server must have seen
+CHECKS = [
+    ('error_retried', 'getUserInfo', ['error'], 0, None, 'OK', 2),
+    ('drop_retried', 'getUserInfo', ['drop'], 0, None, 'OK', 2),
+    ('invalid_retried', 'getUserInfo', ['invalid'], 0, None, 'OK', 2),
+    ('send_not_replayed', 'sendMessage', ['error'], 0, None, 'ServerUnavailable', 1),
+    ('unavailable_raised', 'getUserInfo', ['error'] * 3, 0, None, 'ServerUnavailable', 3),
+    ('invalid_raised', 'getUserInfo', ['invalid'] * 3, 0, None, 'InvalidResponse', 3),
+    ('timeout_raised', 'getUserInfo', [], 0.5, 0.2, 'RequestTimeout', 1),
+]
+
+
+async def check(method: str, script: list, delay: float, deadline, attempts: int) -> tuple:
+    server = StubServer(Crypto.secret(32), faults=FaultInjector(script=script, delay=delay))
+    await server.start()
+    client = await connect_client(server, cache=False, rate_limiter=False,
+                                  retry_policy=RetryPolicy(attempts=attempts, base_delay=0.01,
+                                                           deadline=deadline))
+    outcomes = {method: {}}
+    try:
+        await call(client, method, 0, outcomes, [])
+    finally:
+        await client.disconnect()
+        await server.close()
+
+    return next(iter(outcomes[method])), server.requests
+
+
+async def main(args):
+    faults = FaultInjector(error_rate=args.error_rate, drop_rate=args.drop_rate,
+                           throttle_rate=args.throttle_rate, invalid_rate=args.invalid_rate,
+                           delay=args.delay / 1000, seed=args.seed)
+    server = StubServer(Crypto.secret(32), faults=faults)
+    await server.start()
+    client = await connect_client(server, cache=False, rate_limiter=False,
+                                  retry_policy=RetryPolicy(attempts=args.attempts, base_delay=0.01,
+                                                           deadline=args.deadline))
+    outcomes = {'getUserInfo': {}, 'sendMessage': {}}
+    latencies = []
+    try:
+        await asyncio.gather(*[call(client, method, index, outcomes, latencies)
+                               for index in range(args.calls)
+                               for method in outcomes])
+    finally:
+        await client.disconnect()
+        await server.close()
+
+    checks, failed = {}, []
+    for name, method, script, delay, deadline, expected, requests in CHECKS:
+        outcome, seen = await check(method, script, delay, deadline, attempts=3)
+        checks[name] = {'outcome': outcome, 'requests': seen,
+                        'ok': outcome == expected and seen == requests}
+        if not checks[name]['ok']:
+            failed.append(name)
+
+    latencies.sort()
+    print(json.dumps({
+        'benchmark': 'faults',
+        'calls': args.calls * len(outcomes),
+        'server_requests': server.requests,
+        'injected': faults.injected,
+        'outcomes': outcomes,
+        'p50_ms': round(statistics.median(latencies) * 1000, 3),
+        'p99_ms': round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3),
+        'checks': checks,
+        'failed': failed,
+    }))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=100)
+    parser.add_argument('--attempts', type=int, default=3)
+    parser.add_argument('--deadline', type=float, default=None, help='seconds per call')
+    parser.add_argument('--error-rate', type=float, default=0.1)
+    parser.add_argument('--drop-rate', type=float, default=0.05)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--invalid-rate', type=float, default=0.02)
+    parser.add_argument('--delay', type=float, default=5, help='server delay in ms')
+    parser.add_argument('--seed', type=int, default=1)
+    asyncio.run(main(parser.parse_args()))
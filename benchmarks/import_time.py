@@ -0,0 +1,52 @@
+"""Measure how long ``import pyshad`` takes in a fresh interpreter.
+
+Prints the result as json and exits with status 1 when the median is over
+the target, so it can guard the import time budget, e.g.
+
+    python benchmarks/import_time.py --runs 10 --target 0.75
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CODE = ('import time, resource; start = time.perf_counter(); import {module}; '
+        'print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)')
+
+
+def measure(module: str) -> tuple:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+    # run outside the repository so the pyshad/types package cannot shadow the stdlib
+    output = subprocess.check_output([sys.executable, '-c', CODE.format(module=module)],
+                                     env=env, cwd=os.path.dirname(root))
+    seconds, rss = output.split()[-2:]
+    return float(seconds), int(rss)
+
+
+def main(args) -> int:
+    results = [measure(args.module) for _ in range(args.runs)]
+    seconds = sorted(result[0] for result in results)
+    median = statistics.median(seconds)
+    print(json.dumps({
+        'benchmark': 'import_time',
+        'module': args.module,
+        'runs': args.runs,
+        'median_s': round(median, 4),
+        'min_s': round(seconds[0], 4),
+        'max_s': round(seconds[-1], 4),
+        'max_rss_kb': max(result[1] for result in results),
+        'target_s': args.target,
+        'ok': median <= args.target,
+    }))
+    return 0 if median <= args.target else 1
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--module', default='pyshad')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--target', type=float, default=0.75, help='seconds')
+    sys.exit(main(parser.parse_args()))
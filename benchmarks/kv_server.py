@@ -0,0 +1,124 @@
+"""Local stand-in for a redis server, enough of resp for ``RedisStorage``.
+
+It keeps every key in memory and understands PING, AUTH, SELECT, GET,
+MGET, SET (with EX/PX), DEL, EXISTS and FLUSHDB, e.g.
+
+    python benchmarks/kv_server.py --port 6380
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class KVServer:
+    def __init__(self) -> None:
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self.commands = 0
+        self.url: Optional[str] = None
+        self.port: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        item = self.data.get(key)
+        if item is None:
+            return None
+
+        value, expires = item
+        if expires is not None and expires < time.monotonic():
+            del self.data[key]
+            return None
+
+        return value
+
+    @staticmethod
+    def bulk(value: Optional[bytes]) -> bytes:
+        return b'$-1\r\n' if value is None else b'$%d\r\n%s\r\n' % (len(value), value)
+
+    def call(self, args: List[bytes]) -> bytes:
+        self.commands += 1
+        command = args[0].upper()
+        if command == b'PING':
+            return b'+PONG\r\n'
+
+        if command in (b'AUTH', b'SELECT'):
+            return b'+OK\r\n'
+
+        if command == b'GET':
+            return self.bulk(self.get(args[1]))
+
+        if command == b'MGET':
+            return b'*%d\r\n' % (len(args) - 1) + b''.join(self.bulk(self.get(key)) for key in args[1:])
+
+        if command == b'SET':
+            expires = None
+            options = [arg.upper() for arg in args[3::2]]
+            for option, value in zip(options, args[4::2]):
+                if option == b'EX':
+                    expires = time.monotonic() + int(value)
+                elif option == b'PX':
+                    expires = time.monotonic() + int(value) / 1000
+            self.data[args[1]] = (args[2], expires)
+            return b'+OK\r\n'
+
+        if command in (b'DEL', b'EXISTS'):
+            keys = [key for key in args[1:] if self.get(key) is not None]
+            if command == b'DEL':
+                for key in keys:
+                    del self.data[key]
+            return b':%d\r\n' % len(keys)
+
+        if command == b'FLUSHDB':
+            self.data.clear()
+            return b'+OK\r\n'
+
+        return b"-ERR unknown command '%s'\r\n" % command
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                args = []
+                for _ in range(int(line[1:-2])):
+                    length = int((await reader.readline())[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+
+                writer.write(self.call(args))
+                await writer.drain()
+
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+
+        finally:
+            writer.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> int:
+        self._server = await asyncio.start_server(self.handle, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.url = f'redis://{host}:{self.port}'
+        return self.port
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+async def main(args):
+    server = KVServer()
+    await server.start(args.host, args.port)
+    print(f'listening on {server.url}')
+    await asyncio.Event().wait()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=6379)
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
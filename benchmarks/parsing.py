@@ -0,0 +1,86 @@
+"""Cost of Markdown.to_metadata and Results.find_keys.
+
+to_metadata runs on texts with a growing number of markdown spans,
+find_keys looks up a key at the top, at the bottom and nowhere in a
+nested result of --depth levels, e.g.
+
+    python benchmarks/parsing.py --spans 1 10 100 --depth 8
+"""
+import argparse
+import copy
+import json
+import time
+
+from pyshad.parser import Markdown
+from pyshad.types import Results
+
+SPANS = ['**bold**', '`mono`', '__italic__', '--underline--', '~~strike~~', '||spoiler||',
+         '[mention](u0stub)', '[link](https://example.com)']
+
+
+def make_text(spans: int) -> str:
+    return ' '.join(f'word {SPANS[index % len(SPANS)]}' for index in range(spans))
+
+
+def make_result(depth: int, width: int) -> dict:
+    result = {'status': 'OK', 'leaf': {'message_id': '1', 'text': 'bottom'}}
+    for level in range(depth):
+        result = {
+            **{f'key{level}_{index}': index for index in range(width)},
+            # find_keys only descends into the first nested value
+            'child': result,
+            'items': [{'object_guid': f'u0{index}'} for index in range(width)],
+        }
+    return {'top': True, **result}
+
+
+def per_call(function, values: list) -> float:
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def markdown(args) -> dict:
+    parser = Markdown()
+    result = {}
+    for spans in args.spans:
+        text = make_text(spans)
+        # fewer runs for long texts, the parser is quadratic in the span count
+        runs = max(10, args.runs // max(1, spans))
+        took = per_call(parser.to_metadata, [text] * runs)
+        result[str(spans)] = {
+            'us_per_call': round(took, 2),
+            'chars_per_second': round(len(text) / took * 1e6),
+        }
+    return result
+
+
+def find_keys(args) -> dict:
+    data = make_result(args.depth, args.width)
+    result = {}
+    assert Results(copy.deepcopy(data)).find_keys('leaf') is not None
+    for name, key in (('top', 'top'), ('bottom', 'leaf'), ('missing', 'absent')):
+        # find_keys wraps nested lists in place, so every call gets a fresh copy
+        values = [Results(copy.deepcopy(data)) for _ in range(args.runs)]
+        result[name] = round(per_call(lambda value: value.find_keys(key), values), 2)
+    return result
+
+
+def main(args):
+    print(json.dumps({
+        'benchmark': 'parsing',
+        'to_metadata': markdown(args),
+        'find_keys_us': find_keys(args),
+        'depth': args.depth,
+        'width': args.width,
+    }))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--spans', type=int, nargs='+', default=[1, 10, 50])
+    parser.add_argument('--depth', type=int, default=6)
+    parser.add_argument('--width', type=int, default=10)
+    parser.add_argument('--runs', type=int, default=2000)
+    main(parser.parse_args())
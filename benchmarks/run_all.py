@@ -0,0 +1,148 @@
+"""Run the benchmark suite and write every result into one json document.
+
+Each benchmark runs in its own interpreter, the document records the
+commit and python it ran on. With --baseline the numbers are compared to
+an earlier document and the run exits with status 1 on a regression, e.g.
+
+    python benchmarks/run_all.py --output results.json
+    python benchmarks/run_all.py --quick --baseline results.json --threshold 0.25
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+# name, script, arguments of a full run and of a --quick run
+SUITE = [
+    ('import_time', 'import_time.py', ['--runs', '5'], ['--runs', '3']),
+    ('builder', 'builder.py', ['--calls', '1000'], ['--calls', '200']),
+    ('updates_1_handler', 'updates.py', ['--updates', '20000', '--handlers', '1', '--filters', '2'],
+     ['--updates', '2000', '--handlers', '1', '--filters', '2']),
+    ('updates_10_handlers', 'updates.py', ['--updates', '5000', '--handlers', '10', '--filters', '2'],
+     ['--updates', '500', '--handlers', '10', '--filters', '2']),
+    ('parsing', 'parsing.py', [], ['--runs', '500']),
+    ('transfer', 'transfer.py', ['--size', '32'], ['--size', '4']),
+    ('storage', 'storage.py', [], ['--keys', '2000']),
+    ('sync_calls', 'sync_calls.py', [], ['--calls', '2000']),
+    ('startup', 'startup.py', [], ['--rtt', '50', '--runs', '2']),
+    ('faults', 'faults.py', [], ['--calls', '50']),
+    ('workers', 'workers.py', [], ['--accounts', '2', '--updates', '100']),
+]
+
+HIGHER_IS_BETTER = ('per_second',)
+LOWER_IS_BETTER = ('_ms', '_us', '_s', 'us_per_call')
+
+
+def commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def run(script: str, args: list, timeout: float) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    start = time.perf_counter()
+    try:
+        process = subprocess.run([sys.executable, os.path.join(HERE, script), *args], env=env,
+                                 capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {'error': 'timeout', 'seconds': timeout}
+
+    # a benchmark may exit with 1 to report a missed target, its json is still valid,
+    # the client can print warnings before it, so only the last json line counts
+    lines = [line for line in process.stdout.splitlines() if line.startswith('{')]
+    try:
+        result = json.loads(lines[-1])
+    except (IndexError, ValueError):
+        return {'error': process.stderr.strip().splitlines()[-1:] or 'no output',
+                'returncode': process.returncode}
+
+    result['wall_s'] = round(time.perf_counter() - start, 3)
+    # a failed check or a missed target still prints its json, the status says it failed
+    result['returncode'] = process.returncode
+    return result
+
+
+def failed(result: dict) -> bool:
+    return 'error' in result or result.get('returncode', 0) != 0
+
+
+def metrics(result, path: str = ''):
+    # flatten to (path, value, direction), direction 1 when higher is better
+    if isinstance(result, dict):
+        for key, value in result.items():
+            yield from metrics(value, f'{path}.{key}' if path else key)
+
+    elif isinstance(result, (int, float)) and not isinstance(result, bool):
+        parts = path.split('.')
+        if any(part.endswith(HIGHER_IS_BETTER) for part in parts):
+            yield path, result, 1
+        elif parts[-1] != 'wall_s' and any(part.endswith(LOWER_IS_BETTER) for part in parts):
+            yield path, result, -1
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    old = {path: value for path, value, _ in metrics(baseline.get('results', {}))}
+    regressions = []
+    for path, value, direction in metrics(results):
+        before = old.get(path)
+        if not before or not value:
+            continue
+
+        change = (value / before - 1) * direction
+        if change < -threshold:
+            regressions.append({'metric': path, 'baseline': before, 'value': value,
+                                'change': round(change, 3)})
+    return regressions
+
+
+def main(args):
+    results = {}
+    for name, script, full, quick in SUITE:
+        if args.only and name not in args.only:
+            continue
+
+        results[name] = run(script, quick if args.quick else full, args.timeout)
+        status = 'error' if 'error' in results[name] else 'failed' if failed(results[name]) else 'ok'
+        print(f'{name}: {status}', file=sys.stderr)
+
+    document = {
+        'timestamp': int(time.time()),
+        'commit': commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'quick': args.quick,
+        'results': results,
+        'failed': [name for name, result in results.items() if failed(result)],
+    }
+    if args.baseline:
+        with open(args.baseline) as file:
+            document['regressions'] = compare(results, json.load(file), args.threshold)
+
+    output = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output)
+    else:
+        print(output)
+
+    sys.exit(1 if document['failed'] or document.get('regressions') else 0)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--quick', action='store_true', help='smaller runs, for a fast check')
+    parser.add_argument('--only', nargs='+', choices=[name for name, *_ in SUITE])
+    parser.add_argument('--output', help='write the document here instead of stdout')
+    parser.add_argument('--baseline', help='an earlier document to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative slowdown')
+    parser.add_argument('--timeout', type=float, default=600, help='seconds per benchmark')
+    main(parser.parse_args())
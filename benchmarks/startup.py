@@ -0,0 +1,84 @@
+"""Cold vs warm start of dc discovery.
+
+A local server stands in for shgetdcmess and answers after ``--rtt``
+milliseconds. The cold run starts from an empty session, the warm run
+reuses the dc list cached in the session by the cold run.
+
+    python benchmarks/startup.py --rtt 150 --runs 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+import aiohttp
+from aiohttp import web
+
+from pyshad.endpoints import EndpointManager
+from pyshad.sessions import SQLiteSession
+
+DCS = {
+    'API': {'1': 'http://127.0.0.1:1'},
+    'socket': {'1': 'ws://127.0.0.1:1'},
+    'default_api': '1',
+    'default_socket': '1',
+}
+
+
+async def start_server(rtt: float):
+    async def dcs(request):
+        await asyncio.sleep(rtt)
+        return web.json_response({'status': 'OK', 'data': DCS})
+
+    app = web.Application()
+    app.router.add_get('/', dcs)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f'http://127.0.0.1:{port}/'
+
+
+async def discover(session_path: str, dcs_url: str) -> float:
+    start = time.perf_counter()
+    session = SQLiteSession(session_path)
+    endpoints = EndpointManager(store=session, dcs_url=dcs_url, probe_timeout=0.1)
+    async with aiohttp.ClientSession() as http:
+        await endpoints.discover(http)
+        elapsed = time.perf_counter() - start
+        await endpoints.close()
+
+    session._connection.close()
+    return elapsed
+
+
+async def main(rtt: float, runs: int):
+    runner, dcs_url = await start_server(rtt)
+    cold, warm = [], []
+    try:
+        for run in range(runs):
+            path = os.path.join(tempfile.mkdtemp(), f'startup{run}')
+            cold.append(await discover(path, dcs_url))
+            warm.append(await discover(path, dcs_url))
+
+    finally:
+        await runner.cleanup()
+
+    print(json.dumps({
+        'benchmark': 'startup',
+        'rtt_ms': rtt * 1000,
+        'runs': runs,
+        'cold_ms': round(min(cold) * 1000, 3),
+        'warm_ms': round(min(warm) * 1000, 3),
+    }))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rtt', type=float, default=150, help='simulated round trip in ms')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rtt / 1000, args.runs))
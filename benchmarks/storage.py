@@ -0,0 +1,97 @@
+"""Measure batched get/set of the storage backends.
+
+The redis backend runs against the local stand-in of kv_server.py unless
+--redis points at a real server, e.g.
+
+    python benchmarks/storage.py --keys 20000 --batch 100
+    python benchmarks/storage.py --redis 127.0.0.1:6379
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from pyshad.storage import MemoryStorage, RedisStorage, SQLiteStorage
+
+from kv_server import KVServer
+
+
+async def measure(storage, keys: int, batch: int, ttl: float) -> dict:
+    value = {'auth': 'a' * 32, 'state': int(time.time()), 'guids': ['u0stub'] * 4}
+    names = [f'key:{index}' for index in range(keys)]
+    batches = [names[index:index + batch] for index in range(0, keys, batch)]
+
+    start = time.perf_counter()
+    for names_batch in batches:
+        await storage.set_many({name: value for name in names_batch}, ttl=ttl)
+    set_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = 0
+    for names_batch in batches:
+        found += len(await storage.get_many(names_batch))
+    get_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name in names[:min(keys, 1000)]:
+        await storage.get(name)
+    single_time = (time.perf_counter() - start) / min(keys, 1000)
+
+    await storage.set('expiring', value, ttl=0.05)
+    await asyncio.sleep(0.1)
+    assert found == keys and await storage.get('expiring') is None
+
+    # a call cancelled after its command was sent must not shift the replies of the next
+    await storage.set_many({'a': 'A', 'b': 'B'})
+    for delay in (0, 0.0001, 0.001):
+        task = asyncio.ensure_future(storage.get('a'))
+        await asyncio.sleep(delay)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert await storage.get('b') == 'B' and await storage.get('a') == 'A'
+
+    return {
+        'set_per_second': keys / set_time,
+        'get_per_second': keys / get_time,
+        'single_get_us': single_time * 1e6,
+    }
+
+
+async def main(args):
+    server = None
+    if args.redis:
+        host, _, port = args.redis.partition(':')
+        redis = RedisStorage(host, int(port or 6379), prefix='pyshad-benchmark:')
+    else:
+        server = KVServer()
+        await server.start()
+        redis = RedisStorage('127.0.0.1', server.port)
+
+    backends = {
+        'memory': MemoryStorage(),
+        'sqlite': SQLiteStorage(os.path.join(tempfile.mkdtemp(), 'storage.db')),
+        'redis': redis,
+    }
+    results = {}
+    try:
+        for name, storage in backends.items():
+            results[name] = await measure(storage, args.keys, args.batch, args.ttl)
+            await storage.close()
+
+    finally:
+        if server is not None:
+            await server.close()
+
+    print(json.dumps({'benchmark': 'storage', 'keys': args.keys, 'batch': args.batch,
+                      'backends': results}))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--keys', type=int, default=10000)
+    parser.add_argument('--batch', type=int, default=100)
+    parser.add_argument('--ttl', type=float, default=60)
+    parser.add_argument('--redis', help='host:port of a real server instead of the stand-in')
+    asyncio.run(main(parser.parse_args()))
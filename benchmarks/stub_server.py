@@ -0,0 +1,206 @@
+"""Local stand-in for the Shad api, used by the benchmarks and fault runs.
+
+It speaks the ``data_enc``/``sign`` protocol of ``Network.send`` (the
+signature is not verified) and answers every method with the data
+returned by the matching entry of ``StubServer.methods``. ``/upload`` and
+``/file`` take the chunked uploads and ranged downloads of the file apis.
+"""
+import asyncio
+import os
+import random
+import tempfile
+from typing import Callable, Dict, Optional
+
+from aiohttp import web
+
+from pyshad import Client
+from pyshad.crypto import Crypto
+
+
+class FaultInjector:
+    def __init__(self,
+                 error_rate: float = 0.0,
+                 drop_rate: float = 0.0,
+                 throttle_rate: float = 0.0,
+                 invalid_rate: float = 0.0,
+                 delay: float = 0.0,
+                 jitter: float = 0.0,
+                 status: int = 503,
+                 seed: Optional[int] = None,
+                 script: Optional[list] = None) -> None:
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.throttle_rate = throttle_rate
+        self.invalid_rate = invalid_rate
+        self.delay = delay
+        self.jitter = jitter
+        self.status = status
+        self.random = random.Random(seed)
+        # faults of the first requests, in order, before the rates apply
+        self.script = list(script or [])
+        self.injected: Dict[str, int] = {}
+
+    def pick(self) -> Optional[str]:
+        if self.script:
+            fault = self.script.pop(0)
+            if fault is not None:
+                self.injected[fault] = self.injected.get(fault, 0) + 1
+            return fault
+
+        value = self.random.random()
+        for fault, rate in (('drop', self.drop_rate), ('error', self.error_rate),
+                            ('throttle', self.throttle_rate), ('invalid', self.invalid_rate)):
+            if value < rate:
+                self.injected[fault] = self.injected.get(fault, 0) + 1
+                return fault
+            value -= rate
+
+    async def wait(self) -> None:
+        delay = self.delay + self.random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class StubServer:
+    def __init__(self, auth: str, faults: Optional[FaultInjector] = None) -> None:
+        self.auth = auth
+        self.key = Crypto.passphrase(auth)
+        self.faults = faults or FaultInjector()
+        self.methods: Dict[str, Callable[[dict], dict]] = {
+            'getUserInfo': lambda input: {'user': {'user_guid': input.get('user_guid', 'u0stub'),
+                                                   'first_name': 'stub'}},
+            'sendMessage': lambda input: {'message_update': {'object_guid': input.get('object_guid'),
+                                                             'message_id': str(self.requests)}},
+            'requestSendFile': lambda input: {'id': str(self.requests), 'dc_id': '1',
+                                              'upload_url': self.url + 'upload',
+                                              'access_hash_send': 'stub'},
+        }
+        self.requests = 0
+        self.uploaded = 0
+        # served by ranged downloads, whatever file_id is asked for
+        self.file = os.urandom(1048576)
+        self.sockets = []
+        # answer socket upgrades with 403, like a proxy that kills websockets
+        self.reject_sockets = False
+        self.url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    def encrypt(self, data: dict) -> str:
+        return Crypto.encrypt(data, key=self.key)
+
+    async def handle_dcs(self, request: web.Request) -> web.Response:
+        return web.json_response({'status': 'OK', 'data': self.dcs()})
+
+    def dcs(self) -> dict:
+        return {'API': {'1': self.url.rstrip('/')}, 'default_api': '1',
+                'socket': {'1': self.url.replace('http', 'ws', 1) + 'ws'}, 'default_socket': '1',
+                'storages': {'1': self.url + 'file'}}
+
+    async def handle_api(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        body = await request.json()
+        await self.faults.wait()
+        fault = self.faults.pick()
+
+        if fault == 'drop':
+            request.transport.close()
+            return web.Response()
+
+        if fault == 'error':
+            return web.Response(status=self.faults.status)
+
+        if fault == 'invalid':
+            return web.Response(text='<html>bad gateway</html>')
+
+        payload = Crypto.decrypt(body['data_enc'], key=self.key)
+        if fault == 'throttle':
+            result = {'status': 'ERROR_ACTION', 'status_det': 'TOO_REQUESTS'}
+
+        else:
+            handler = self.methods.get(payload['method'], lambda input: {})
+            result = {'status': 'OK', 'status_det': 'OK', 'data': handler(payload.get('input') or {})}
+
+        return web.json_response({'data_enc': self.encrypt(result)})
+
+    async def handle_upload(self, request: web.Request) -> web.Response:
+        self.uploaded += len(await request.read())
+        if request.headers['part-number'] != request.headers['total-part']:
+            return web.json_response({'status': 'OK', 'status_det': 'OK', 'data': None})
+
+        return web.json_response({'status': 'OK', 'status_det': 'OK',
+                                  'data': {'access_hash_rec': 'stub'}})
+
+    async def handle_file(self, request: web.Request) -> web.Response:
+        start = int(request.headers['start-index'])
+        last = int(request.headers['last-index'])
+        offset, size = start % len(self.file), last + 1 - start
+        data = self.file[offset:offset + size]
+        if len(data) < size:
+            data = (self.file * (size // len(self.file) + 2))[offset:offset + size]
+        return web.Response(body=data)
+
+    async def handle_ws(self, request: web.Request) -> web.StreamResponse:
+        if self.reject_sockets:
+            return web.Response(status=403)
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        try:
+            async for _ in ws:
+                pass
+
+        finally:
+            self.sockets.remove(ws)
+
+        return ws
+
+    async def push(self, updates: dict, user_guid: str = 'u0stub') -> None:
+        # send an update the way the socket does, e.g. {'message_updates': [...]}
+        data = {'data_enc': self.encrypt({'user_guid': user_guid, **updates})}
+        for ws in list(self.sockets):
+            await ws.send_json(data)
+
+    async def drop_sockets(self) -> None:
+        for ws in list(self.sockets):
+            await ws.close()
+
+    def app(self) -> web.Application:
+        # upload chunks are 2 MB, past the default 1 MB body limit
+        app = web.Application(client_max_size=64 * 1048576)
+        app.router.add_get('/', self.handle_dcs)
+        app.router.add_post('/', self.handle_api)
+        app.router.add_get('/ws', self.handle_ws)
+        app.router.add_post('/upload', self.handle_upload)
+        app.router.add_post('/file', self.handle_file)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f'http://{host}:{port}/'
+        return self.url
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def attach(self, client) -> None:
+        # point a connected client at this server instead of the real dcs
+        client.connection.endpoints.load(self.dcs())
+        client.connection.dcs_loaded = True
+
+
+async def connect_client(server: StubServer, **kwargs) -> Client:
+    _, private_key = Crypto.create_keys()
+    client = Client(os.path.join(tempfile.mkdtemp(), 'stub'), **kwargs)
+    await client.connect()
+    client.auth = server.auth
+    client.key = Crypto.passphrase(server.auth)
+    client.decode_auth = Crypto.decode_auth(server.auth)
+    client.private_key = private_key
+    server.attach(client)
+    return client
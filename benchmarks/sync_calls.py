@@ -0,0 +1,72 @@
+"""Compare the overhead of blocking calls through pyshad.sync and client.sync.
+
+The called coroutine does nothing, so the numbers are the cost of crossing
+from sync code into the event loop and back, e.g.
+
+    python benchmarks/sync_calls.py --calls 20000
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+
+from pyshad.facade import LoopThread, SyncClient
+from pyshad.sync import async_to_sync
+
+
+class Target:
+    async def noop(self, value=None):
+        return value
+
+
+def per_call(function, calls: int) -> float:
+    start = time.perf_counter()
+    for index in range(calls):
+        function(index)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def in_thread(function, calls: int) -> float:
+    result = []
+    thread = threading.Thread(target=lambda: result.append(per_call(function, calls)))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def main(args):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    wrapped = Target()
+    async_to_sync(wrapped, 'noop')
+
+    # from other threads the old wrapper hands the call to the loop it saw when wrapping
+    main_loop = LoopThread()
+    asyncio.set_event_loop(main_loop.loop)
+    threaded = Target()
+    async_to_sync(threaded, 'noop')
+    asyncio.set_event_loop(loop)
+
+    facade = SyncClient(Target())
+    results = {
+        'sync_main_thread_us': per_call(wrapped.noop, args.calls),
+        'sync_worker_thread_us': in_thread(threaded.noop, args.calls),
+        'facade_main_thread_us': per_call(facade.noop, args.calls),
+        'facade_worker_thread_us': in_thread(facade.noop, args.calls),
+    }
+
+    start = time.perf_counter()
+    facade.map(facade.client.noop, range(args.calls))
+    results['facade_map_us'] = (time.perf_counter() - start) / args.calls * 1e6
+
+    main_loop.stop()
+    facade.loop_thread.stop()
+    print(json.dumps({'benchmark': 'sync_calls', 'calls': args.calls,
+                      **{key: round(value, 2) for key, value in results.items()}}))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=10000)
+    main(parser.parse_args())
@@ -0,0 +1,57 @@
+"""Upload and download throughput against the stub server, in MB/s.
+
+Uploads go through Network.upload_file (requestSendFile and the chunked
+posts), downloads through Network.download with ranged requests, e.g.
+
+    python benchmarks/transfer.py --size 32 --upload-chunk 2048 --download-chunk 128
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from pyshad.crypto import Crypto
+
+from stub_server import StubServer, connect_client
+
+
+async def main(args):
+    server = StubServer(Crypto.secret(32))
+    await server.start()
+    client = await connect_client(server, cache=False, rate_limiter=False)
+    size = args.size * 1048576
+    data = os.urandom(size)
+    try:
+        start = time.perf_counter()
+        result = await client.connection.upload_file(data, file_name='benchmark.bin',
+                                                     chunk=args.upload_chunk * 1024)
+        upload_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        downloaded = await client.connection.download(dc_id=result.dc_id, file_id=result.file_id,
+                                                      access_hash=result.access_hash_rec, size=size,
+                                                      chunk=args.download_chunk * 1024)
+        download_time = time.perf_counter() - start
+
+    finally:
+        await client.disconnect()
+        await server.close()
+
+    assert server.uploaded == size and len(downloaded) == size
+    print(json.dumps({
+        'benchmark': 'transfer',
+        'size_mb': args.size,
+        'upload_chunk_kb': args.upload_chunk,
+        'download_chunk_kb': args.download_chunk,
+        'upload_mb_per_second': round(args.size / upload_time, 2),
+        'download_mb_per_second': round(args.size / download_time, 2),
+    }))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=16, help='file size in MB')
+    parser.add_argument('--upload-chunk', type=int, default=2048, help='KB per upload request')
+    parser.add_argument('--download-chunk', type=int, default=128, help='KB per download request')
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,93 @@
+"""Updates per second through update_handler with N handlers and filters.
+
+Packets are encrypted like the socket sends them and fed to
+``Network.update_handler``, which decrypts, dedups and dispatches them.
+Every update matches every handler, so each one runs --handlers times, e.g.
+
+    python benchmarks/updates.py --updates 20000 --handlers 10 --filters 3
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from pyshad import filters, handlers
+from pyshad.crypto import Crypto
+
+from stub_server import StubServer, connect_client
+
+FILTERS = [
+    lambda: filters.is_group,
+    lambda: filters.object_guid() == 'g0stub',
+    lambda: filters.RegexModel(r'^/start'),
+    lambda: filters.author_guid() != 'u0other',
+]
+
+
+def make_update(index: int) -> dict:
+    return {
+        'object_guid': 'g0stub',
+        'action': 'New',
+        'message_id': str(index),
+        'type': 'Group',
+        'message': {'message_id': str(index), 'text': f'/start {index}', 'type': 'Text',
+                    'author_object_guid': 'u0stub'},
+    }
+
+
+async def main(args):
+    server = StubServer(Crypto.secret(32))
+    await server.start()
+    client = await connect_client(server)
+    expected = args.updates * args.handlers
+    calls = 0
+    done = asyncio.Event()
+
+    def make_handler():
+        # client.handlers is keyed by function, so every handler needs its own
+        async def handler(update):
+            nonlocal calls
+            calls += 1
+            if calls >= expected:
+                done.set()
+        return handler
+
+    for _ in range(args.handlers):
+        models = [FILTERS[index % len(FILTERS)]() for index in range(args.filters)]
+        client.add_handler(make_handler(), handlers.MessageUpdates(*models))
+
+    packets = [{'data_enc': server.encrypt({'user_guid': 'u0stub', 'message_updates': [
+        make_update(index) for index in range(start, min(start + args.batch, args.updates))]})}
+        for start in range(0, args.updates, args.batch)]
+
+    try:
+        start = time.perf_counter()
+        for packet in packets:
+            await client.connection.update_handler(packet)
+        await asyncio.wait_for(done.wait(), args.timeout)
+        elapsed = time.perf_counter() - start
+
+    finally:
+        await client.disconnect()
+        await server.close()
+
+    print(json.dumps({
+        'benchmark': 'updates',
+        'updates': args.updates,
+        'batch': args.batch,
+        'handlers': args.handlers,
+        'filters': args.filters,
+        'handler_calls': calls,
+        'updates_per_second': round(args.updates / elapsed, 1),
+        'handler_calls_per_second': round(calls / elapsed, 1),
+    }))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--updates', type=int, default=10000)
+    parser.add_argument('--batch', type=int, default=10, help='updates per socket packet')
+    parser.add_argument('--handlers', type=int, default=5)
+    parser.add_argument('--filters', type=int, default=2, help='filters per handler')
+    parser.add_argument('--timeout', type=float, default=120)
+    asyncio.run(main(parser.parse_args()))
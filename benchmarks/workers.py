@@ -0,0 +1,97 @@
+"""Run accounts in worker processes against the stub server's websocket.
+
+Pushes updates to every socket, reports as json how fast the workers
+forwarded them to the parent and whether a killed worker came back. The
+run exits with status 1 when an update was not forwarded or the worker
+was not restarted, e.g.
+
+    python benchmarks/workers.py --accounts 8 --workers 4 --updates 1000
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from pyshad.crypto import Crypto
+from pyshad.endpoints import EndpointManager
+from pyshad.sessions import SQLiteSession
+from pyshad.workers import ProcessRunner
+
+from stub_server import StubServer
+
+
+async def wait_for(condition, timeout: float) -> bool:
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+async def main(args):
+    server = StubServer(Crypto.secret(32))
+    await server.start()
+
+    directory = tempfile.mkdtemp()
+    cache_path = os.path.join(directory, 'dcs.json')
+    EndpointManager(cache_path=cache_path).write_cache(server.dcs())
+    accounts = []
+    for index in range(args.accounts):
+        name = os.path.join(directory, f'account{index}')
+        SQLiteSession(name).insert('989120000000', server.auth, f'u0account{index}', 'stub',
+                                   Crypto.create_keys()[1])
+        accounts.append(name)
+
+    received = []
+    runner = ProcessRunner(accounts, workers=args.workers, metrics_interval=0.5, restart_delay=0.2,
+                           on_update=lambda account, name, package: received.append(len(package)),
+                           dc_cache_path=cache_path)
+    await runner.start()
+    supervisor = asyncio.ensure_future(runner.supervise())
+    try:
+        await wait_for(lambda: len(server.sockets) == args.accounts, args.timeout)
+        expected = args.updates * args.accounts
+        start = time.perf_counter()
+        for index in range(args.updates):
+            await server.push({'message_updates': [{'object_guid': 'g0stub', 'message_id': str(index),
+                                                    'action': 'New', 'message': {'message_id': str(index)}}]})
+        await wait_for(lambda: sum(received) >= expected, args.timeout)
+        elapsed = time.perf_counter() - start
+
+        runner.workers[0].process.kill()
+        restarted = await wait_for(lambda: runner.workers[0].restarts and
+                                   len(server.sockets) == args.accounts, args.timeout)
+        stats = runner.stats()
+
+    finally:
+        supervisor.cancel()
+        await runner.stop()
+        await server.close()
+
+    forwarded = sum(received) == expected
+    print(json.dumps({
+        'benchmark': 'workers',
+        'accounts': args.accounts,
+        'workers': len(runner.workers),
+        'updates': sum(received),
+        'expected': expected,
+        'updates_per_second': round(sum(received) / elapsed, 1),
+        'restarted': bool(restarted),
+        'totals': stats['totals'],
+        'ok': forwarded and bool(restarted),
+    }))
+    if not forwarded or not restarted:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--accounts', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--updates', type=int, default=500)
+    parser.add_argument('--timeout', type=float, default=60)
+    asyncio.run(main(parser.parse_args()))
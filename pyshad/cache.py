@@ -0,0 +1,212 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set
+
+# seconds a result stays cached, per api method
+DEFAULT_TTLS = {
+    'getUserInfo': 300,
+    'getGroupInfo': 120,
+    'getChannelInfo': 120,
+    'getObjectByUsername': 600,
+    'getAbsObjects': 300,
+}
+
+GUID_KEYS = ('user_guid', 'group_guid', 'channel_guid', 'object_guid')
+
+
+class TTLCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = 300) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+
+        value, expires = item
+        if expires < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if self.maxsize <= 0:
+            return
+
+        self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def keys(self) -> Set[Hashable]:
+        return set(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class SQLiteCache:
+    def __init__(self, path: str) -> None:
+        if not path.endswith('.cache'):
+            path += '.cache'
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('create table if not exists cache (key text primary key'
+                                 ', value text, expires real)')
+        self._connection.execute('create table if not exists guids (guid text, key text'
+                                 ', primary key (guid, key))')
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute('select value, expires from cache where key = ?',
+                                           (key,)).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float, guids: Iterable[str] = ()) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('insert or replace into cache (key, value, expires)'
+                                     ' values (?, ?, ?)',
+                                     (key, json.dumps(value, default=str), time.time() + ttl))
+            self._connection.executemany('insert or ignore into guids (guid, key) values (?, ?)',
+                                         [(guid, key) for guid in guids])
+
+    def invalidate(self, guid: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('delete from cache where key in'
+                                     ' (select key from guids where guid = ?)', (guid,))
+            self._connection.execute('delete from guids where guid = ?', (guid,))
+
+    def purge(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('delete from cache where expires < ?', (time.time(),))
+            self._connection.execute('delete from guids where key not in (select key from cache)')
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class ObjectCache:
+    def __init__(self,
+                 maxsize: int = 1024,
+                 ttls: Optional[Dict[str, float]] = None,
+                 store: Optional[SQLiteCache] = None) -> None:
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+
+        self.memory = TTLCache(maxsize=maxsize)
+        self.store = store
+        self._guids: Dict[str, Set[str]] = {}
+
+    @staticmethod
+    def key(name: str, input: Optional[dict]) -> Optional[str]:
+        if not input:
+            return None
+
+        return f'{name}:{json.dumps(input, sort_keys=True, default=str)}'
+
+    @staticmethod
+    def guids(input: Optional[dict], data: Optional[dict] = None) -> Set[str]:
+        result = set()
+        for value in (input or {}).values():
+            if isinstance(value, str) and len(value) > 1 and value[1] == '0':
+                result.add(value)
+            elif isinstance(value, list):
+                result.update(item for item in value if isinstance(item, str))
+
+        # usernames resolve to a guid that only the response knows
+        for value in [data or {}, *(v for v in (data or {}).values() if isinstance(v, dict))]:
+            result.update(value[key] for key in GUID_KEYS if isinstance(value.get(key), str))
+
+        return result
+
+    def get(self, name: str, input: Optional[dict]) -> Optional[dict]:
+        if name not in self.ttls:
+            return None
+
+        key = self.key(name, input)
+        if key is None:
+            return None
+
+        data = self.memory.get(key)
+        if data is None and self.store is not None:
+            data = self.store.get(key)
+            if data is not None:
+                # index the promoted copy too, or invalidate() would miss it
+                for guid in self.guids(input, data):
+                    self._guids.setdefault(guid, set()).add(key)
+                self.memory.set(key, data, ttl=self.ttls[name])
+
+        return data
+
+    def set(self, name: str, input: Optional[dict], data: dict) -> None:
+        key = self.key(name, input)
+        if name not in self.ttls or key is None or not isinstance(data, dict):
+            return
+
+        ttl = self.ttls[name]
+        data = dict(data)
+        guids = self.guids(input, data)
+        for guid in guids:
+            self._guids.setdefault(guid, set()).add(key)
+
+        self.memory.set(key, data, ttl=ttl)
+        if len(self._guids) > 4 * max(self.memory.maxsize, 1):
+            self.prune()
+        if self.store is not None:
+            self.store.set(key, data, ttl, guids)
+
+    def invalidate(self, guid: str) -> None:
+        if not guid:
+            return
+
+        for key in self._guids.pop(guid, ()):
+            self.memory.delete(key)
+
+        if self.store is not None:
+            self.store.invalidate(guid)
+
+    def prune(self) -> None:
+        # forget index entries of keys the lru already evicted
+        keys = self.memory.keys()
+        self._guids = {guid: guid_keys & keys for guid, guid_keys in self._guids.items()
+                       if guid_keys & keys}
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self._guids.clear()
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self.memory),
+            'maxsize': self.memory.maxsize,
+            'hits': self.memory.hits,
+            'misses': self.memory.misses,
+        }
@@ -1,5 +1,16 @@
-from .sessions import SQLiteSession, StringSession
+from .sessions import SQLiteSession, StringSession, StorageSession
 from .parser import Markdown
+from .network import Network
+from .pool import ConnectionPool
+from .singleflight import SingleFlight
+from .cache import ObjectCache
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .store import MessageStore
+from .search import SearchIndex
+from .dedup import UpdateDeduplicator
+from .endpoints import EndpointManager
+from .facade import SyncClient
 from .methods import Methods
 from typing import Optional, Union
 
@@ -24,6 +35,18 @@ class Client(Methods):
                  timeout: Optional[Union[str, int]] = 20,
                  lang_code: Optional[str] = 'fa',
                  parse_mode: Optional[str] = 'All',
+                 dc_cache_path: Optional[str] = None,
+                 dc_cache_ttl: Optional[int] = 3600,
+                 pool: Optional[ConnectionPool] = None,
+                 cache: Optional[Union[ObjectCache, bool]] = None,
+                 rate_limiter: Optional[Union[RateLimiter, bool]] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 message_store: Optional[Union[str, MessageStore]] = None,
+                 search_index: Optional[Union[str, SearchIndex]] = None,
+                 dedup: Optional[Union[UpdateDeduplicator, bool]] = None,
+                 update_transport: Optional[str] = 'auto',
+                 endpoints: Optional[EndpointManager] = None,
+                 max_concurrency: Optional[int] = None,
                  ) -> None:
         super().__init__()
         if auth and not isinstance(auth, str):
@@ -45,16 +68,41 @@ class Client(Methods):
         if not isinstance(timeout, int):
             timeout = int(timeout)
 
+        if dc_cache_path is not None and not isinstance(dc_cache_path, str):
+            raise ValueError('`dc_cache_path` is `string` arg.')
+
+        if pool is not None and not isinstance(pool, ConnectionPool):
+            raise TypeError('`pool` is `pyshad.pool.ConnectionPool` arg.')
+
+        if endpoints is not None and not isinstance(endpoints, EndpointManager):
+            raise TypeError('`endpoints` is `pyshad.endpoints.EndpointManager` arg.')
+
+        if max_concurrency is not None and not isinstance(max_concurrency, int):
+            raise ValueError('`max_concurrency` is `int` arg.')
+
+        if message_store is not None and not isinstance(message_store, (str, MessageStore)):
+            raise TypeError('`message_store` is `string` or `pyshad.store.MessageStore` arg.')
+
+        if search_index is not None and not isinstance(search_index, (str, SearchIndex)):
+            raise TypeError('`search_index` is `string` or `pyshad.search.SearchIndex` arg.')
+
         if isinstance(name, str):
             session = SQLiteSession(name)
 
-        elif not isinstance(name, StringSession):
+        elif isinstance(name, (StringSession, SQLiteSession, StorageSession)):
+            session = name
+
+        else:
             raise TypeError('The given session must be a '
-                            'str or [rubpy.sessions.StringSession]')
+                            'str, [rubpy.sessions.StringSession], [rubpy.sessions.SQLiteSession]'
+                            ' or [rubpy.sessions.StorageSession]')
 
         if parse_mode not in ('All', 'html', 'markdown', 'mk'):
             raise ValueError('The `parse_mode` argument can only be in `("All", "html", "markdown", "mk")`.')
 
+        if update_transport not in ('auto', 'websocket', 'polling'):
+            raise ValueError('The `update_transport` argument can only be in `("auto", "websocket", "polling")`.')
+
         self.DEFAULT_PLATFORM['lang_code'] = lang_code
         self.name = name
         self.auth = auth
@@ -66,6 +114,10 @@ class Client(Methods):
         self.timeout = timeout
         self.session = session
         self.parse_mode = parse_mode
+        self.dc_cache_path = dc_cache_path
+        self.dc_cache_ttl = dc_cache_ttl
+        self.own_pool = pool is None
+        self.pool = pool or ConnectionPool(timeout=timeout, headers=Network.HEADERS)
         self.markdown = Markdown()
         self.database = None
         self.decode_auth = None
@@ -73,6 +125,34 @@ class Client(Methods):
         self.guid = None
         self.key = None
         self.handlers = {}
+        # called with (name, package, user_guid) for every update before the handlers
+        self.update_listeners = []
+        self.single_flight = SingleFlight()
+        self.cache = ObjectCache() if cache is None or cache is True else cache or None
+        self.rate_limiter = (RateLimiter() if rate_limiter is None or rate_limiter is True
+                             else rate_limiter or None)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.message_store = (MessageStore(message_store) if isinstance(message_store, str)
+                              else message_store)
+        self.search_index = (SearchIndex(search_index) if isinstance(search_index, str)
+                             else search_index)
+        self.dedup = UpdateDeduplicator() if dedup is None or dedup is True else dedup or None
+        self.update_transport = update_transport
+        # a shared endpoint manager lets many clients discover the dcs once
+        self.endpoints = endpoints
+        self.max_concurrency = max_concurrency
+        self.concurrency = None
+        # requests sent and not answered yet, counted by builder
+        self.in_flight = 0
+        self._sync = None
+
+    @property
+    def sync(self) -> "SyncClient":
+        """Blocking facade of this client, running it on a dedicated loop thread."""
+        if self._sync is None:
+            self._sync = SyncClient(self)
+
+        return self._sync
 
     def __enter__(self):
         return self.start()
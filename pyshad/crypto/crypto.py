@@ -12,13 +12,6 @@ from Crypto.Cipher import PKCS1_OAEP
 from string import ascii_lowercase, ascii_uppercase
 
 
-
-def save_private(private):
-    s = open("my_private.txt", 'wt')
-    s.write(private)
-    s.close()
-
-
 class Crypto:
     AES_IV = b'\x00' * 16
 
@@ -101,7 +94,6 @@ class Crypto:
         Returns:
             dict: The decrypted data as a dictionary.
         """
-        save_private(key)
         aes = AES.new(key.encode(), AES.MODE_CBC, cls.AES_IV)
         dec = aes.decrypt(base64.urlsafe_b64decode(data.encode('UTF-8')))
         return json.loads(unpad(dec, AES.block_size).decode('UTF-8'))
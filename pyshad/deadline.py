@@ -0,0 +1,76 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Awaitable, Optional
+
+from . import exceptions
+
+# absolute time.monotonic() value every api call in the current context must finish by
+_deadline: ContextVar[Optional[float]] = ContextVar('pyshad_deadline', default=None)
+
+
+def current() -> Optional[float]:
+    return _deadline.get()
+
+
+def resolve(timeout: Optional[float] = None, deadline: Optional[float] = None) -> Optional[float]:
+    candidates = [value for value in (deadline, current()) if value is not None]
+    if timeout is not None:
+        candidates.append(time.monotonic() + timeout)
+
+    return min(candidates) if candidates else None
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def check(deadline: Optional[float], method: Optional[str] = None) -> None:
+    if deadline is not None and deadline <= time.monotonic():
+        raise exceptions.RequestTimeout(f'{method or "request"} exceeded its deadline',
+                                        method=method)
+
+
+async def wait(awaitable: Awaitable, deadline: Optional[float], method: Optional[str] = None):
+    left = remaining(deadline)
+    if left is None:
+        return await awaitable
+
+    if left <= 0:
+        # close the coroutine so it is not reported as never awaited
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        check(deadline, method)
+
+    try:
+        return await asyncio.wait_for(awaitable, left)
+
+    except asyncio.TimeoutError:
+        raise exceptions.RequestTimeout(f'{method or "request"} exceeded its deadline',
+                                        method=method) from None
+
+
+class timeout:
+    """Bound every api call made inside the block, retries included.
+
+        with timeout(5):
+            await client.get_chats()
+    """
+
+    def __init__(self, seconds: Optional[float] = None, deadline: Optional[float] = None) -> None:
+        self.seconds = seconds
+        self.deadline = deadline
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_deadline.set(resolve(self.seconds, self.deadline)))
+        return self
+
+    def __exit__(self, *args):
+        _deadline.reset(self._tokens.pop())
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, *args):
+        return self.__exit__(*args)
@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class UpdateDeduplicator:
+    """Remember recently dispatched updates by (object_guid, message_id, action).
+
+    At most maxsize keys are kept, each for ttl seconds, stored as their
+    64 bit hash so the memory use stays around 250 bytes per key.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: Optional[float] = 600) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._seen: "OrderedDict[int, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    @staticmethod
+    def key(update: dict) -> Optional[tuple]:
+        message_id = update.get('message_id')
+        if message_id is None:
+            return None
+
+        return update.get('object_guid'), str(message_id), update.get('action')
+
+    def seen(self, update: dict) -> bool:
+        """Return True if update was already seen, otherwise remember it."""
+        key = self.key(update)
+        if key is None:
+            return False
+
+        now = time.monotonic()
+        self.expire(now)
+        key = hash(key)
+        if key in self._seen:
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        self._seen[key] = now
+        while len(self._seen) > self.maxsize:
+            self._seen.popitem(last=False)
+
+        return False
+
+    def expire(self, now: Optional[float] = None) -> None:
+        if self.ttl is None:
+            return
+
+        limit = (time.monotonic() if now is None else now) - self.ttl
+        while self._seen:
+            key, added = next(iter(self._seen.items()))
+            if added >= limit:
+                break
+
+            del self._seen[key]
+
+    def clear(self) -> None:
+        self._seen.clear()
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self._seen),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
@@ -0,0 +1,292 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+DCS_URL = 'https://shgetdcmess.iranlms.ir/'
+
+DEFAULT_API_URLS = ['https://shadmessenger162.iranlms.ir',
+                    'https://shadmessenger75.iranlms.ir',
+                    'https://shadmessenger28.iranlms.ir']
+
+DEFAULT_SOCKETS = ['wss://shsocket8.iranlms.ir:80',
+                   'wss://shsocket4.iranlms.ir:80',
+                   'wss://shsocket11.iranlms.ir:80']
+
+
+class Endpoint:
+    # weight of the newest sample in the latency moving average
+    SMOOTHING = 0.3
+
+    def __init__(self, url: str, priority: int = 0) -> None:
+        self.url = url
+        self.priority = priority
+        self.latency: Optional[float] = None
+        self.successes = 0
+        self.failures = 0
+        self.errors = 0
+        self.disabled_until = 0.0
+
+    def __repr__(self) -> str:
+        return (f'Endpoint(url={self.url!r}, latency={self.latency}, '
+                f'error_rate={self.error_rate:.2f})')
+
+    @property
+    def error_rate(self) -> float:
+        total = self.successes + self.failures
+        return self.failures / total if total else 0.0
+
+    @property
+    def available(self) -> bool:
+        return self.disabled_until <= time.monotonic()
+
+    def score(self) -> float:
+        # endpoints that were never measured keep the order of the dc list
+        latency = self.latency if self.latency is not None else 1.0 + self.priority / 1000
+        return latency * (1 + 4 * self.error_rate)
+
+    def success(self, latency: float) -> None:
+        self.successes += 1
+        self.errors = 0
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.SMOOTHING * (latency - self.latency)
+
+    def error(self) -> None:
+        self.failures += 1
+        self.errors += 1
+
+
+class EndpointManager:
+    def __init__(self,
+                 store=None,
+                 cache_path: Optional[str] = None,
+                 cache_ttl: int = 3600,
+                 failover_after: int = 3,
+                 cooldown: int = 60,
+                 probe_timeout: int = 5,
+                 dcs_url: str = DCS_URL) -> None:
+        # sessions that can keep the dc list are preferred over a cache file
+        if not hasattr(store, 'dcs') or cache_path is not None:
+            store = None
+
+        if store is None and cache_path is None:
+            cache_path = os.path.join(tempfile.gettempdir(), 'pyshad_dcs.json')
+
+        self.store = store
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self.dcs_url = dcs_url
+        self.failover_after = failover_after
+        self.cooldown = cooldown
+        self.probe_timeout = probe_timeout
+        self.apis: Dict[str, Endpoint] = {}
+        self.sockets: Dict[str, Endpoint] = {}
+        self.storages: Dict[str, str] = {}
+        self._probe_task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._discover_task: Optional[asyncio.Future] = None
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def api_url(self) -> Optional[str]:
+        endpoint = self.best(self.apis)
+        return endpoint.url + '/' if endpoint else None
+
+    @property
+    def wss_url(self) -> Optional[str]:
+        endpoint = self.best(self.sockets)
+        return endpoint.url if endpoint else None
+
+    def best(self, endpoints: Dict[str, Endpoint]) -> Optional[Endpoint]:
+        if not endpoints:
+            return None
+
+        candidates = [e for e in endpoints.values() if e.available] or list(endpoints.values())
+        return min(candidates, key=Endpoint.score)
+
+    def ranking(self) -> dict:
+        return {
+            'API': sorted(self.apis.values(), key=Endpoint.score),
+            'socket': sorted(self.sockets.values(), key=Endpoint.score),
+        }
+
+    def load(self, data: dict) -> None:
+        def ordered(urls: dict, default) -> List[str]:
+            urls = [url for url in (urls or {}).values() if url]
+            if default in urls:
+                urls.remove(default)
+                urls.insert(0, default)
+            return urls
+
+        apis = data.get('API') or {}
+        sockets = data.get('socket') or {}
+        api_urls = ordered(apis, apis.get(data.get('default_api')))
+        socket_urls = ordered(sockets, sockets.get(data.get('default_socket')))
+
+        def endpoints(urls: List[str], old: Dict[str, Endpoint]) -> Dict[str, Endpoint]:
+            # keep the measurements of hosts that are still listed
+            result = {}
+            for index, url in enumerate(urls):
+                endpoint = old.get(url) or Endpoint(url)
+                endpoint.priority = index
+                result[url] = endpoint
+            return result
+
+        self.apis = endpoints([url.rstrip('/') for url in api_urls or DEFAULT_API_URLS], self.apis)
+        self.sockets = endpoints(socket_urls or DEFAULT_SOCKETS, self.sockets)
+        self.storages = data.get('storages') or {}
+
+    def read_cache(self):
+        if self.store is not None:
+            return self.store.dcs()
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as file:
+                cache = json.load(file)
+
+        except (OSError, ValueError):
+            return None
+
+        return cache.get('data'), cache.get('time', 0)
+
+    async def aread_cache(self):
+        # sessions with an async api read the cached dcs off the event loop thread
+        if self.store is not None and hasattr(self.store, 'adcs'):
+            return await self.store.adcs()
+
+        return self.read_cache()
+
+    def write_cache(self, data: dict) -> None:
+        if self.store is not None:
+            return self.store.insert_dcs(data)
+
+        tmp_path = f'{self.cache_path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump({'time': time.time(), 'data': data}, file)
+            os.replace(tmp_path, self.cache_path)
+
+        except OSError:
+            pass
+
+    async def fetch(self, session: aiohttp.ClientSession, attempts: int = 3) -> Optional[dict]:
+        for attempt in range(attempts):
+            try:
+                async with session.get(self.dcs_url) as response:
+                    if response.ok:
+                        return (await response.json(content_type=None)).get('data')
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as error:
+                print(f'Failed to get dcs ({attempt + 1}):', error)
+
+            await asyncio.sleep(attempt + 1)
+
+    async def discover(self, session: aiohttp.ClientSession, force: bool = False) -> bool:
+        # clients sharing this manager wait for one discovery instead of each running their own
+        if not force and self.loaded_at is not None and time.time() - self.loaded_at < self.cache_ttl / 2:
+            return True
+
+        if self._discover_task is None or self._discover_task.done():
+            self._discover_task = asyncio.ensure_future(self._discover(session, force))
+
+        return await asyncio.shield(self._discover_task)
+
+    async def _discover(self, session: aiohttp.ClientSession, force: bool = False) -> bool:
+        cache = None if force else await self.aread_cache()
+        data, age = None, None
+
+        if cache is not None and cache[0]:
+            data, age = cache[0], time.time() - cache[1]
+
+        if data is None or age > self.cache_ttl:
+            fresh = await self.fetch(session)
+            if fresh is not None:
+                self.write_cache(fresh)
+                data, age = fresh, 0
+
+        # a cached list past half of its lifetime is served and renewed in the background
+        elif age > self.cache_ttl / 2:
+            self.refresh(session)
+
+        self.load(data or {})
+        if data is not None:
+            self.loaded_at = time.time() - age
+
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self.probe(session))
+
+        return data is not None
+
+    def refresh(self, session: aiohttp.ClientSession) -> asyncio.Task:
+        async def refresh():
+            data = await self.fetch(session)
+            if data is not None:
+                self.write_cache(data)
+                self.load(data)
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(refresh())
+
+        return self._refresh_task
+
+    async def probe(self, session: aiohttp.ClientSession) -> None:
+        async def probe_api(endpoint: Endpoint):
+            start = time.monotonic()
+            try:
+                async with session.get(endpoint.url,
+                                       timeout=aiohttp.ClientTimeout(self.probe_timeout)):
+                    endpoint.success(time.monotonic() - start)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                endpoint.error()
+
+        async def probe_socket(endpoint: Endpoint):
+            url = urlparse(endpoint.url)
+            start = time.monotonic()
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(url.hostname, url.port or 443),
+                    self.probe_timeout)
+                endpoint.success(time.monotonic() - start)
+                writer.close()
+
+            except (OSError, asyncio.TimeoutError):
+                endpoint.error()
+
+        await asyncio.gather(*[probe_api(e) for e in self.apis.values()],
+                             *[probe_socket(e) for e in self.sockets.values()])
+
+    def report(self, url: str, latency: Optional[float] = None) -> None:
+        endpoint = self.find(url)
+        if endpoint is None:
+            return
+
+        if latency is None:
+            endpoint.error()
+            if endpoint.errors >= self.failover_after:
+                endpoint.disabled_until = time.monotonic() + self.cooldown
+                endpoint.errors = 0
+                print(f'Endpoint {endpoint.url} failed repeatedly, '
+                      f'disabled for {self.cooldown} seconds')
+
+        else:
+            endpoint.success(latency)
+
+    def find(self, url: str) -> Optional[Endpoint]:
+        if url is None:
+            return None
+
+        url = url.rstrip('/')
+        return self.apis.get(url) or self.sockets.get(url)
+
+    async def close(self) -> None:
+        for task in (self._probe_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
@@ -20,6 +20,29 @@ class RequestError(ClientError):
         self.request = request
 
 
+class NetworkError(ClientError):
+    def __init__(self, message, method=None, url=None, attempts=0):
+        super().__init__(message)
+        self.message = str(message)
+        self.method = method
+        self.url = url
+        self.attempts = attempts
+
+
+class RequestTimeout(NetworkError):
+    pass
+
+
+class ServerUnavailable(NetworkError):
+    def __init__(self, message, method=None, url=None, attempts=0, status=None):
+        super().__init__(message, method=method, url=url, attempts=attempts)
+        self.status = status
+
+
+class InvalidResponse(NetworkError):
+    pass
+
+
 class UploadError(Exception):
     def __init__(self, status, status_det, dev_message: str=None):
         self.status = status
@@ -111,6 +134,9 @@ class ExcetionsHandler:
         self.name = name
 
     def __getattr__(self, name):
+        if name in globals():
+            return globals()[name]
+
         name = ''.join([chunk.title() for chunk in name.split('_')])
         return globals().get(name, ClientError)
 
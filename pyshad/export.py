@@ -0,0 +1,86 @@
+import json
+import os
+import sqlite3
+from typing import Any, Union
+
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+
+def to_dict(item: Any) -> Any:
+    if hasattr(item, 'original_update'):
+        item = item.original_update
+
+    elif hasattr(item, 'dict') and callable(item.dict):
+        return item.dict(exclude_none=True)
+
+    if isinstance(item, dict):
+        return {key: to_dict(value) for key, value in item.items()
+                if key != 'original_update'}
+
+    if isinstance(item, list):
+        return [to_dict(value) for value in item]
+
+    return item
+
+
+class NDJSONWriter:
+    def __init__(self, path: str, mode: str = 'w') -> None:
+        self.path = path
+        self.count = 0
+        self._file = open(path, mode, encoding='utf-8')
+
+    def write(self, item: Any) -> None:
+        self._file.write(json.dumps(to_dict(item), ensure_ascii=False, default=str) + '\n')
+        self.count += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SQLiteWriter:
+    def __init__(self, path: str, table: str, key: str, batch_size: int = 500) -> None:
+        self.path = path
+        self.table = table
+        self.key = key
+        self.batch_size = batch_size
+        self.count = 0
+        self._rows = []
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(f'create table if not exists {table} ({key} text primary key, data text)')
+        self._connection.commit()
+
+    def write(self, item: Any) -> None:
+        data = to_dict(item)
+        self._rows.append((data.get(self.key), json.dumps(data, ensure_ascii=False, default=str)))
+        self.count += 1
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._rows:
+            with self._connection:
+                self._connection.executemany(f'insert or replace into {self.table}'
+                                             f' ({self.key}, data) values (?, ?)', self._rows)
+            self._rows.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
+
+
+def open_writer(output: Union[str, Any], table: str, key: str, mode: str = 'w'):
+    """Return a writer for output, sqlite for .db/.sqlite files and ndjson otherwise.
+
+    Objects that already have write and close methods are returned as is.
+    """
+    if hasattr(output, 'write') and hasattr(output, 'close'):
+        return output
+
+    output = os.fspath(output)
+    if output.endswith(SQLITE_SUFFIXES):
+        return SQLiteWriter(output, table=table, key=key)
+
+    return NDJSONWriter(output, mode=mode)
@@ -0,0 +1,201 @@
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, Callable, Coroutine, Iterable, List, Optional
+
+
+class Call:
+    """Result of a coroutine submitted to a LoopThread, waited for with a plain lock."""
+
+    __slots__ = ('_lock', '_value', '_error', '_loop', '_task')
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self._lock = threading.Lock()
+        self._lock.acquire()
+        self._value = None
+        self._error = None
+        self._loop = loop
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(self, coroutine: Coroutine) -> None:
+        # releasing the lock here saves the loop iteration of a done callback
+        try:
+            self._value = await coroutine
+
+        except BaseException as exc:
+            self._error = exc
+
+        finally:
+            self._lock.release()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        if not self._lock.acquire(timeout=-1 if timeout is None else timeout):
+            # stop the coroutine too, a timed out send must not still go out later
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self.cancel)
+            raise TimeoutError('the call did not finish in time')
+
+        self._lock.release()
+        if self._error is not None:
+            raise self._error
+
+        return self._value
+
+    def cancel(self) -> None:
+        # runs on the loop thread, after _start since call_soon keeps the order
+        if self._task is not None:
+            self._task.cancel()
+
+
+class LoopThread:
+    """An event loop running forever in its own daemon thread."""
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name=name or 'pyshad-loop', daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+
+        finally:
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+    def _start(self, coroutine: Coroutine, call: Call) -> None:
+        call._task = self.loop.create_task(call.run(coroutine))
+
+    def submit(self, coroutine: Coroutine) -> Call:
+        if threading.current_thread() is self.thread:
+            coroutine.close()
+            raise RuntimeError('a sync call can not wait for its own loop thread, await it instead')
+
+        call = Call(self.loop)
+        self.loop.call_soon_threadsafe(self._start, coroutine, call)
+        return call
+
+    def run(self, coroutine: Coroutine, timeout: Optional[float] = None) -> Any:
+        return self.submit(coroutine).result(timeout)
+
+    def stop(self) -> None:
+        if self.thread.is_alive():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+
+
+class SyncIterator:
+    """Thread-safe blocking iterator over an async generator running on a LoopThread."""
+
+    def __init__(self, loop_thread: LoopThread, agen) -> None:
+        self.loop_thread = loop_thread
+        self.agen = agen
+        self._lock = threading.Lock()
+        self._done = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._lock:
+            if self._done:
+                raise StopIteration
+
+            try:
+                return self.loop_thread.run(self.agen.__anext__())
+
+            except StopAsyncIteration:
+                self._done = True
+                raise StopIteration from None
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._done:
+                self._done = True
+                self.loop_thread.run(self.agen.aclose())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class SyncClient:
+    """Blocking facade of a client, every call runs on one loop thread of that client.
+
+        client.sync.start()
+        client.sync.send_message('u0...', 'hi')
+        users = client.sync.map(client.get_user_info, guids)
+        for member in client.sync.iter_members('g0...'):
+            ...
+    """
+
+    def __init__(self, client) -> None:
+        self.client = client
+        self.loop_thread = LoopThread(name=f'pyshad-{id(client):x}')
+
+    def __getattr__(self, name: str):
+        function = getattr(self.client, name)
+        if inspect.isasyncgenfunction(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                return SyncIterator(self.loop_thread, function(*args, **kwargs))
+
+        elif inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                return self.loop_thread.run(function(*args, **kwargs))
+
+        else:
+            return function
+
+        # cache the wrapper, the next lookup does not reach __getattr__
+        self.__dict__[name] = wrapper
+        return wrapper
+
+    def __dir__(self):
+        return sorted({*super().__dir__(), *dir(self.client)})
+
+    def run(self, coroutine: Coroutine, timeout: Optional[float] = None) -> Any:
+        return self.loop_thread.run(coroutine, timeout)
+
+    def map(self,
+            function: Callable,
+            *iterables: Iterable,
+            concurrency: Optional[int] = None,
+            return_exceptions: bool = False) -> List[Any]:
+        """Call an async function for every item at once, wait for all of them.
+
+        Everything is submitted to the loop thread in one go, the results
+        come back in the order of the items.
+        """
+        if isinstance(function, str):
+            function = getattr(self.client, function)
+
+        async def run_all():
+            semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+            async def run_one(args):
+                if semaphore is None:
+                    return await function(*args)
+
+                async with semaphore:
+                    return await function(*args)
+
+            return await asyncio.gather(*(run_one(args) for args in zip(*iterables)),
+                                        return_exceptions=return_exceptions)
+
+        return self.loop_thread.run(run_all())
+
+    def iterate(self, agen) -> SyncIterator:
+        return SyncIterator(self.loop_thread, agen)
+
+    def close(self) -> None:
+        """Disconnect the client if it is connected and stop the loop thread."""
+        if hasattr(self.client, 'connection'):
+            self.loop_thread.run(self.client.disconnect())
+
+        self.loop_thread.stop()
@@ -52,9 +52,12 @@ class Operator:
 
 
 class BaseModel:
-    def __init__(self, func=None, filters=[], *args, **kwargs) -> None:
+    def __init__(self, func=None, filters=None, *args, **kwargs) -> None:
         self.func = func
-        if not isinstance(filters, list):
+        # a shared default list would leak comparisons into every other model
+        if filters is None:
+            filters = []
+        elif not isinstance(filters, list):
             filters = [filters]
         self.filters = filters
 
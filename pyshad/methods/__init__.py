@@ -1,33 +1,103 @@
-from .advanced import Advanced
-from .utilities import Utilities
-from .users import Users
-from .auth import Auth
-from .messages import Messages
-from .chats import Chats
-from .groups import Groups
-from .decorators import Decorators
-from .contacts import Contacts
-from .settings import Settings
-from .stickers import Stickers
-from .channels import Channels
-from .extras import Exctras
-from .gif import Gifs
-
-
-class Methods(
-    Advanced,
-    Utilities,
-    Users,
-    Auth,
-    Messages,
-    Chats,
-    Groups,
-    Decorators,
-    Contacts,
-    Settings,
-    Stickers,
-    Channels,
-    Exctras,
-    Gifs,
-):
-    pass
\ No newline at end of file
+from importlib import import_module
+
+# the category packages in the order Methods inherited them, a method defined
+# in more than one category comes from the first
+CATEGORIES = {
+    'Advanced': 'advanced',
+    'Utilities': 'utilities',
+    'Users': 'users',
+    'Auth': 'auth',
+    'Messages': 'messages',
+    'Chats': 'chats',
+    'Groups': 'groups',
+    'Decorators': 'decorators',
+    'Contacts': 'contacts',
+    'Settings': 'settings',
+    'Stickers': 'stickers',
+    'Channels': 'channels',
+    'Exctras': 'extras',
+    'Gifs': 'gif',
+}
+
+
+def lazy_module_getattr(namespace: dict, category: str, mixins: dict):
+    """Module __getattr__ and __dir__ of a category package.
+
+    A mixin module is only imported the first time its class is used, the
+    category class itself is built from all of them.
+    """
+    package = namespace['__name__']
+
+    def __getattr__(name):
+        if name in mixins:
+            value = getattr(import_module(f'{package}.{mixins[name]}'), name)
+
+        elif name == category:
+            value = type(name, tuple(__getattr__(mixin) for mixin in mixins), {'__module__': package})
+
+        else:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted([*namespace, category, *mixins])
+
+    return __getattr__, __dir__
+
+
+def registry() -> dict:
+    # every client method and the module it is defined in, read from the MIXINS
+    # of the categories, a method is named after its module unless NAMES says otherwise
+    methods = {}
+    for package in CATEGORIES.values():
+        category = import_module(f'{__name__}.{package}')
+        names = getattr(category, 'NAMES', {})
+        for module in category.MIXINS.values():
+            for name in names.get(module, (module,)):
+                methods.setdefault(name, f'{package}.{module}')
+
+    return methods
+
+
+class LazyMethod:
+    def __init__(self, name: str, module: str) -> None:
+        self.name = name
+        self.module = module
+        self.__doc__ = f'{name}, defined in {__name__}.{module}'
+
+    def load(self):
+        module = import_module(f'{__name__}.{self.module}')
+        for value in vars(module).values():
+            if isinstance(value, type) and value.__module__ == module.__name__ and self.name in vars(value):
+                return vars(value)[self.name]
+
+        raise AttributeError(f'{module.__name__} does not define {self.name}')
+
+    def __get__(self, instance, owner=None):
+        function = self.load()
+        # from now on the function itself is found, without this descriptor
+        setattr(Methods, self.name, function)
+        return function.__get__(instance, owner)
+
+
+class Methods:
+    pass
+
+
+METHODS = registry()
+for name, module in METHODS.items():
+    setattr(Methods, name, LazyMethod(name, module))
+
+
+def __getattr__(name):
+    # the category mixins (Messages, Chats, ...) are still importable from here
+    if name in CATEGORIES:
+        return getattr(import_module(f'{__name__}.{CATEGORIES[name]}'), name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted([*globals(), *CATEGORIES])
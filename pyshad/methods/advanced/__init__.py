@@ -1,7 +1,13 @@
-from .build import Builder
+from .. import lazy_module_getattr
 
+# mixin classes in the order Advanced inherits them, and their modules
+MIXINS = {
+    'Builder': 'build',
+}
 
-class Advanced(
-    Builder,
-):
-    pass
\ No newline at end of file
+# modules whose methods are not named after the module
+NAMES = {
+    'build': ('builder',),
+}
+
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Advanced', MIXINS)
@@ -1,7 +1,11 @@
 from ...crypto import Crypto
+from ...ratelimit import THROTTLE_STATUS
+from ... import deadline as deadlines
 from ... import exceptions
 from ...types import Results
-from typing import Union
+from typing import Optional, Union
+import asyncio
+import copy
 import rubpy
 
 
@@ -13,9 +17,14 @@ class Builder:
             encrypt: bool = True,
             dict: bool = False,
             input: dict = None,
+            timeout: Optional[float] = None,
+            deadline: Optional[float] = None,
     ) -> Union[Results, dict]:
+        # timeout is relative seconds, deadline an absolute time.monotonic() value
+        deadline = deadlines.resolve(timeout, deadline)
+
         if not self.connection.api_url:
-            await self.connection.get_dcs()
+            await deadlines.wait(self.connection.get_dcs(), deadline, name)
 
         if self.auth is None:
             self.auth = Crypto.secret(length=32)
@@ -27,23 +36,82 @@ class Builder:
             # self._client._logger.info(
             #     'create key passphrase', extra={'data': self._client._key})
 
-        result = await self.connection.send(method=name,
-                                            tmp_session=tmp_session,
-                                            encrypt=encrypt,
-                                            input=input)
-        data_enc = result.get('data_enc')
-        if data_enc:
-            result = Crypto.decrypt(data_enc,
-                                    key=self.key)
+        if self.cache is not None and not dict:
+            data = self.cache.get(name, input)
+            if data is not None:
+                # Results wraps nested lists in place, the cached value must stay untouched
+                return Results({**copy.deepcopy(data), '_client': self})
+
+        if self.max_concurrency and self.concurrency is None:
+            self.concurrency = asyncio.Semaphore(self.max_concurrency)
+
+        async def request(deadline=None):
+            self.in_flight += 1
+            try:
+                return await self.connection.send(method=name,
+                                                  tmp_session=tmp_session,
+                                                  encrypt=encrypt,
+                                                  input=input,
+                                                  deadline=deadline)
+            finally:
+                self.in_flight -= 1
+
+        async def send(deadline=None):
+            attempt = 0
+            while True:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(name, input)
+
+                if self.concurrency is not None:
+                    async with self.concurrency:
+                        result = await request(deadline)
+
+                else:
+                    result = await request(deadline)
+
+                data_enc = result.get('data_enc')
+                if data_enc:
+                    deadlines.check(deadline, name)
+                    result = Crypto.decrypt(data_enc,
+                                            key=self.key)
+
+                if self.rate_limiter is None:
+                    return result
+
+                # queue the call again instead of failing while the server throttles us
+                if result.get('status_det') in THROTTLE_STATUS:
+                    if attempt < self.rate_limiter.max_retries:
+                        self.rate_limiter.throttled(name, input, attempt)
+                        attempt += 1
+                        continue
+
+                # the earlier attempts already slowed the bucket down, only a success speeds it up
+                elif result.get('status') == 'OK':
+                    self.rate_limiter.succeeded(name, input)
+
+                return result
+
+        # a shared request is not bound to the deadline of the caller that started it,
+        # every caller only stops waiting for it at its own deadline
+        if name in self.single_flight.methods:
+            result = await deadlines.wait(self.single_flight.do(
+                self.single_flight.key(name, input, tmp_session), send), deadline, name)
+        else:
+            result = await deadlines.wait(send(deadline), deadline, name)
 
         status = result['status']
         status_det = result['status_det']
 
         if status == 'OK' and status_det == 'OK':
+            if self.cache is not None:
+                self.cache.set(name, input, result.get('data'))
+
+            # the result is shared with the cache and every coalesced caller, each gets a copy
+            data = copy.deepcopy(result.get('data'))
             if dict:
-                return result.get('data')
+                return data
 
-            result['data']['_client'] = self
-            return Results(result['data'])
+            data['_client'] = self
+            return Results(data)
 
         raise exceptions(status_det)(result, request=None)
@@ -1,11 +1,10 @@
-from .register_device import RegisterDevice
-from .send_code import SendCode
-from .sign_in import SignIn
+from .. import lazy_module_getattr
 
+# mixin classes in the order Auth inherits them, and their modules
+MIXINS = {
+    'RegisterDevice': 'register_device',
+    'SendCode': 'send_code',
+    'SignIn': 'sign_in',
+}
 
-class Auth(
-    RegisterDevice,
-    SendCode,
-    SignIn,
-):
-    pass
\ No newline at end of file
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Auth', MIXINS)
@@ -1,29 +1,20 @@
-from .delete_avatar import DeleteAvatar
-from .delete_chat_history import DeleteChatHistory
-from .get_abs_objects import GetAbsObjects
-from .get_avatars import GetAvatars
-from .get_chats import GetChats
-from .get_chats_updates import GetChatsUpdates
-from .get_link_from_app_url import GetLinkFromAppUrl
-from .upload_avatar import UploadAvatar
-from .set_action_chat import SetActionChat
-from .send_chat_activity import SendChatActivity
-from .seen_chats import SeenChats
-from .search_chat_messages import SearchChatMessages
+from .. import lazy_module_getattr
 
+# mixin classes in the order Chats inherits them, and their modules
+MIXINS = {
+    'DeleteAvatar': 'delete_avatar',
+    'DeleteChatHistory': 'delete_chat_history',
+    'GetAbsObjects': 'get_abs_objects',
+    'GetAvatars': 'get_avatars',
+    'GetChats': 'get_chats',
+    'GetChatsUpdates': 'get_chats_updates',
+    'GetLinkFromAppUrl': 'get_link_from_app_url',
+    'UploadAvatar': 'upload_avatar',
+    'SetActionChat': 'set_action_chat',
+    'SendChatActivity': 'send_chat_activity',
+    'SeenChats': 'seen_chats',
+    'SearchChatMessages': 'search_chat_messages',
+    'IterChats': 'iter_chats',
+}
 
-class Chats(
-    DeleteAvatar,
-    DeleteChatHistory,
-    GetAbsObjects,
-    GetAvatars,
-    GetChats,
-    GetChatsUpdates,
-    GetLinkFromAppUrl,
-    UploadAvatar,
-    SetActionChat,
-    SendChatActivity,
-    SeenChats,
-    SearchChatMessages,
-):
-    pass
\ No newline at end of file
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Chats', MIXINS)
@@ -0,0 +1,13 @@
+from ...paginator import paginate
+from typing import Optional
+import rubpy
+
+
+class IterChats:
+    async def iter_chats(
+            self: "rubpy.Client",
+            limit: Optional[int] = None,
+            start_id: Optional[str] = None,
+    ):
+        async for chat in paginate(self.get_chats, 'chats', limit=limit, start_id=start_id):
+            yield chat
@@ -1,13 +1,12 @@
-from .get_contacts_updates import GetContactsUpdates
-from .add_address_book import AddAddressBook
-from .delete_contact import DeleteContact
-from .get_contacts import GetContacts
+from .. import lazy_module_getattr
 
+# mixin classes in the order Contacts inherits them, and their modules
+MIXINS = {
+    'GetContactsUpdates': 'get_contacts_updates',
+    'AddAddressBook': 'add_address_book',
+    'DeleteContact': 'delete_contact',
+    'GetContacts': 'get_contacts',
+    'IterContacts': 'iter_contacts',
+}
 
-class Contacts(
-    GetContactsUpdates,
-    AddAddressBook,
-    DeleteContact,
-    GetContacts,
-):
-    pass
\ No newline at end of file
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Contacts', MIXINS)
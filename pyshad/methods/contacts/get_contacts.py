@@ -7,5 +7,5 @@ class GetContacts:
             self: "rubpy.Client",
             start_id: Optional[Union[str, int]] = None,
     ):
-        return self.builder(name='getContacts',
-                            input={'start_id': str(start_id)})
\ No newline at end of file
+        return await self.builder(name='getContacts',
+                                  input={'start_id': None if start_id is None else str(start_id)})
\ No newline at end of file
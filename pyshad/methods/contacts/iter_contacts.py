@@ -0,0 +1,13 @@
+from ...paginator import paginate
+from typing import Optional
+import rubpy
+
+
+class IterContacts:
+    async def iter_contacts(
+            self: "rubpy.Client",
+            limit: Optional[int] = None,
+            start_id: Optional[str] = None,
+    ):
+        async for user in paginate(self.get_contacts, 'users', limit=limit, start_id=start_id):
+            yield user
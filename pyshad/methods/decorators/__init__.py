@@ -1,15 +1,12 @@
-from .on_message_updates import OnMessageUpdates
-from .on_remove_notifications import OnRemoveNotifications
-from .on_show_notifications import OnShowNotifications
-from .on_chat_updates import OnChatUpdates
-from .on_show_activities import OnShowActivities
+from .. import lazy_module_getattr
 
+# mixin classes in the order Decorators inherits them, and their modules
+MIXINS = {
+    'OnMessageUpdates': 'on_message_updates',
+    'OnChatUpdates': 'on_chat_updates',
+    'OnRemoveNotifications': 'on_remove_notifications',
+    'OnShowActivities': 'on_show_activities',
+    'OnShowNotifications': 'on_show_notifications',
+}
 
-class Decorators(
-    OnMessageUpdates,
-    OnChatUpdates,
-    OnRemoveNotifications,
-    OnShowActivities,
-    OnShowNotifications,
-):
-    pass
\ No newline at end of file
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Decorators', MIXINS)
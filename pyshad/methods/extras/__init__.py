@@ -1,21 +1,20 @@
-from .get_object_by_username import GetObjectByUsername
-from .search_global_objects import SearchGlobalObjects
-from .get_profile_link_items import GetProfileLinkItems
-from .ban_member import BanMember
-from .get_info import GetInfo
-from .join import Join
-from .get_related_objects import GetRelatedObjects
-from .get_transcription import GetTranscription
+from .. import lazy_module_getattr
 
+# mixin classes in the order Exctras inherits them, and their modules
+MIXINS = {
+    'GetObjectByUsername': 'get_object_by_username',
+    'SearchGlobalObjects': 'search_global_objects',
+    'GetProfileLinkItems': 'get_profile_link_items',
+    'BanMember': 'ban_member',
+    'GetInfo': 'get_info',
+    'Join': 'join',
+    'GetRelatedObjects': 'get_related_objects',
+    'GetTranscription': 'get_transcription',
+}
 
-class Exctras(
-    GetObjectByUsername,
-    SearchGlobalObjects,
-    GetProfileLinkItems,
-    BanMember,
-    GetInfo,
-    Join,
-    GetRelatedObjects,
-    GetTranscription,
-):
-    pass
\ No newline at end of file
+# modules whose methods are not named after the module
+NAMES = {
+    'join': ('join_chat',),
+}
+
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Exctras', MIXINS)
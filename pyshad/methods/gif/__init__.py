@@ -1,11 +1,10 @@
-from .get_my_gif_set import GetMyGifSet
-from .add_to_my_gif_set import AddToMyGifSet
-from .remove_from_my_gif_set import RemoveFromMyGifSet
+from .. import lazy_module_getattr
 
+# mixin classes in the order Gifs inherits them, and their modules
+MIXINS = {
+    'GetMyGifSet': 'get_my_gif_set',
+    'AddToMyGifSet': 'add_to_my_gif_set',
+    'RemoveFromMyGifSet': 'remove_from_my_gif_set',
+}
 
-class Gifs(
-    GetMyGifSet,
-    AddToMyGifSet,
-    RemoveFromMyGifSet,
-):
-    pass
\ No newline at end of file
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Gifs', MIXINS)
@@ -1,53 +1,32 @@
-from .add_group import AddGroup
-from .add_group_members import AddGroupMembers
-from .ban_group_member import BanGroupMember
-from .create_group_voice_chat import CreateGroupVoiceChat
-from .delete_no_access_group_chat import DeleteNoAccessGroupChat
-from .edit_group_info import EditGroupInfo
-from .get_banned_group_members import GetBannedGroupMembers
-from .get_group_admin_access_list import GetGroupAdminAccessList
-from .get_group_admin_members import GetGroupAdminMembers
-from .get_group_all_members import GetGroupAllMembers
-from .get_group_default_access import GetGroupDefaultAccess
-from .get_group_info import GetGroupInfo
-from .get_group_link import GetGroupLink
-from .get_group_mention_list import GetGroupMentionList
-from .get_group_voice_chat_updates import GetGroupVoiceChatUpdates
-from .group_preview_by_join_link import GroupPreviewByJoinLink
-from .join_group import JoinGroup
-from .leave_group import LeaveGroup
-from .leave_group_voice_chat import LeaveGroupVoiceChat
-from .remove_group import RemoveGroup
-from .set_group_admin import SetGroupAdmin
-from .set_group_default_access import SetGroupDefaultAccess
-from .set_group_link import SetGroupLink
-from .set_group_voice_chat_setting import SetGroupVoiceChatSetting
+from .. import lazy_module_getattr
 
+# mixin classes in the order Groups inherits them, and their modules
+MIXINS = {
+    'AddGroup': 'add_group',
+    'AddGroupMembers': 'add_group_members',
+    'BanGroupMember': 'ban_group_member',
+    'CreateGroupVoiceChat': 'create_group_voice_chat',
+    'DeleteNoAccessGroupChat': 'delete_no_access_group_chat',
+    'EditGroupInfo': 'edit_group_info',
+    'GetBannedGroupMembers': 'get_banned_group_members',
+    'GetGroupAdminAccessList': 'get_group_admin_access_list',
+    'GetGroupAdminMembers': 'get_group_admin_members',
+    'GetGroupAllMembers': 'get_group_all_members',
+    'GetGroupDefaultAccess': 'get_group_default_access',
+    'GetGroupInfo': 'get_group_info',
+    'GetGroupLink': 'get_group_link',
+    'GetGroupMentionList': 'get_group_mention_list',
+    'GetGroupVoiceChatUpdates': 'get_group_voice_chat_updates',
+    'GroupPreviewByJoinLink': 'group_preview_by_join_link',
+    'JoinGroup': 'join_group',
+    'LeaveGroup': 'leave_group',
+    'LeaveGroupVoiceChat': 'leave_group_voice_chat',
+    'RemoveGroup': 'remove_group',
+    'SetGroupAdmin': 'set_group_admin',
+    'SetGroupDefaultAccess': 'set_group_default_access',
+    'SetGroupLink': 'set_group_link',
+    'SetGroupVoiceChatSetting': 'set_group_voice_chat_setting',
+    'IterBannedGroupMembers': 'iter_banned_group_members',
+}
 
-class Groups(
-    AddGroup,
-    AddGroupMembers,
-    BanGroupMember,
-    CreateGroupVoiceChat,
-    DeleteNoAccessGroupChat,
-    EditGroupInfo,
-    GetBannedGroupMembers,
-    GetGroupAdminAccessList,
-    GetGroupAdminMembers,
-    GetGroupAllMembers,
-    GetGroupDefaultAccess,
-    GetGroupInfo,
-    GetGroupLink,
-    GetGroupMentionList,
-    GetGroupVoiceChatUpdates,
-    GroupPreviewByJoinLink,
-    JoinGroup,
-    LeaveGroup,
-    LeaveGroupVoiceChat,
-    RemoveGroup,
-    SetGroupAdmin,
-    SetGroupDefaultAccess,
-    SetGroupLink,
-    SetGroupVoiceChatSetting,
-):
-    pass
\ No newline at end of file
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Groups', MIXINS)
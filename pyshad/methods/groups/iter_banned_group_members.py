@@ -0,0 +1,17 @@
+from ...paginator import paginate
+from typing import Optional
+import rubpy
+
+
+class IterBannedGroupMembers:
+    async def iter_banned_group_members(
+            self: "rubpy.Client",
+            group_guid: str,
+            limit: Optional[int] = None,
+            start_id: Optional[str] = None,
+    ):
+        async def fetch(start_id):
+            return await self.get_banned_group_members(group_guid, start_id=start_id)
+
+        async for member in paginate(fetch, 'in_chat_members', limit=limit, start_id=start_id):
+            yield member
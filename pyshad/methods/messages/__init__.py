@@ -1,55 +1,44 @@
-from .auto_delete_message import AutoDeleteMessage
-from .create_poll import CreatePoll
-from .delete_messages import DeleteMessages
-from .edit_message import EditMessage
-from .forward_messages import ForwardMessages
-from .get_messages_by_id import GetMessagesByID
-from .get_messages_interval import GetMessagesInterval
-from .get_poll_option_voters import GetPollOptionVoters
-from .get_poll_status import GetPollStatus
-from .request_send_file import RequestSendFile
-from .send_message import SendMessage
-from .send_document import SendDocmuent
-from .send_gif import SendGif
-from .send_music import SendMusic
-from .send_video import SendVideo
-from .send_voice import SendVoice
-from .send_photo import SendPhoto
-from .set_pin_message import SetPinMessage
-from .vote_poll import VotePoll
-from .send_video_message import SendVideoMessage
-from .action_on_message_reaction import ActionOnMessageReaction
-from .reaction import Reaction
-from .remove_reaction import RemoveReaction
-from .get_message_share_url import GetMessageShareUrl
-from .get_messages_updates import GetMessagesUpdates
+from .. import lazy_module_getattr
 
+# mixin classes in the order Messages inherits them, and their modules
+MIXINS = {
+    'AutoDeleteMessage': 'auto_delete_message',
+    'CreatePoll': 'create_poll',
+    'DeleteMessages': 'delete_messages',
+    'EditMessage': 'edit_message',
+    'ForwardMessages': 'forward_messages',
+    'GetMessagesByID': 'get_messages_by_id',
+    'GetMessagesInterval': 'get_messages_interval',
+    'GetPollOptionVoters': 'get_poll_option_voters',
+    'GetPollStatus': 'get_poll_status',
+    'RequestSendFile': 'request_send_file',
+    'SendMessage': 'send_message',
+    'SetPinMessage': 'set_pin_message',
+    'VotePoll': 'vote_poll',
+    'SendDocmuent': 'send_document',
+    'SendGif': 'send_gif',
+    'SendMusic': 'send_music',
+    'SendVideo': 'send_video',
+    'SendVoice': 'send_voice',
+    'SendPhoto': 'send_photo',
+    'SendVideoMessage': 'send_video_message',
+    'ActionOnMessageReaction': 'action_on_message_reaction',
+    'RemoveReaction': 'remove_reaction',
+    'Reaction': 'reaction',
+    'GetMessageShareUrl': 'get_message_share_url',
+    'GetMessagesUpdates': 'get_messages_updates',
+    'PrepareFileInline': 'prepare_file_inline',
+    'Broadcast': 'broadcast',
+    'SyncMessages': 'sync_messages',
+    'SearchMessages': 'search_messages',
+    'BackfillSearchIndex': 'backfill_search_index',
+    'IterHistory': 'iter_history',
+}
 
-class Messages(
-        AutoDeleteMessage,
-        CreatePoll,
-        DeleteMessages,
-        EditMessage,
-        ForwardMessages,
-        GetMessagesByID,
-        GetMessagesInterval,
-        GetPollOptionVoters,
-        GetPollStatus,
-        RequestSendFile,
-        SendMessage,
-        SetPinMessage,
-        VotePoll,
-        SendDocmuent,
-        SendGif,
-        SendMusic,
-        SendVideo,
-        SendVoice,
-        SendPhoto,
-        SendVideoMessage,
-        ActionOnMessageReaction,
-        RemoveReaction,
-        Reaction,
-        GetMessageShareUrl,
-        GetMessagesUpdates,
-):
-        pass
\ No newline at end of file
+# modules whose methods are not named after the module
+NAMES = {
+    'set_pin_message': ('set_pin_message', 'set_pin', 'set_unpin'),
+    'get_message_share_url': ('get_message_url',),
+}
+
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Messages', MIXINS)
@@ -0,0 +1,46 @@
+from typing import Optional, Union
+import rubpy
+
+
+class BackfillSearchIndex:
+    async def backfill_search_index(self: "rubpy.Client",
+                                    object_guid: str,
+                                    middle_message_id: Optional[Union[int, str]] = None,
+                                    since: Optional[int] = None,
+                                    limit: Optional[int] = None,
+                                    batch_size: int = 500) -> int:
+        """_index the history of a chat, walking back from middle_message_id_
+
+        Args:
+            object_guid (str):
+                _chat guid_.
+
+            middle_message_id (int, str, optional):
+                _message to start from_. Defaults to the last message of the chat.
+
+            since (int, optional):
+                _unix time of the oldest message to index_. Defaults to the whole history.
+
+            limit (int, optional):
+                _stop after this many messages_. Defaults to None.
+
+        Returns:
+            int: _indexed messages_.
+        """
+        if self.search_index is None:
+            raise ValueError('`search_index` is not set.')
+
+        count, batch = 0, []
+        async for message in self.iter_history(object_guid, since=since,
+                                               middle_message_id=middle_message_id):
+            batch.append(message)
+            if len(batch) >= batch_size or (limit is not None and count + len(batch) >= limit):
+                count += self.search_index.add_messages(object_guid, batch)
+                batch.clear()
+                if limit is not None and count >= limit:
+                    break
+
+        if batch:
+            count += self.search_index.add_messages(object_guid, batch)
+
+        return count
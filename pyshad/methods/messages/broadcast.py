@@ -0,0 +1,111 @@
+from ...types import Results
+from typing import AsyncIterator, Iterable, Optional, Union
+from pathlib import Path
+import asyncio
+import json
+import os
+import rubpy
+
+
+class Broadcast:
+    async def broadcast(self: "rubpy.Client",
+                        object_guids: Iterable[str],
+                        text: Optional[str] = None,
+                        file_inline: Optional[Union[Path, bytes, str, Results]] = None,
+                        type: str = 'File',
+                        thumb: bool = True,
+                        concurrency: int = 8,
+                        delay: float = 0,
+                        checkpoint: Optional[str] = None, *args, **kwargs) -> AsyncIterator[Results]:
+        """_send one message to many chats_
+
+        Args:
+            object_guids (Iterable[str]):
+                _the chats to send to_.
+
+            file_inline (Path, bytes, str, Results, optional):
+                _uploaded once and reused for every chat_. Defaults to None.
+
+            concurrency (int, optional):
+                _how many messages are sent at the same time_. Defaults to 8.
+
+            delay (float, optional):
+                _seconds each sender waits between two messages_. Defaults to 0.
+
+            checkpoint (str, optional):
+                _ndjson file the outcome of every chat is appended to, chats
+                that already succeeded there are skipped when resuming_. Defaults to None.
+
+        Yields:
+            Results: _object_guid, status ('OK' or the error name) and the
+            result of send_message or the error_.
+        """
+        done = set()
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+
+                    if entry.get('status') == 'OK':
+                        done.add(entry.get('object_guid'))
+
+        if file_inline and not isinstance(file_inline, Results):
+            file_inline = await self.prepare_file_inline(file_inline, type, thumb, *args, **kwargs)
+
+        targets = iter(object_guids)
+        results = asyncio.Queue(maxsize=concurrency * 2)
+        log = open(checkpoint, 'a', encoding='utf-8') if checkpoint is not None else None
+
+        def type_name(exc):
+            return exc.__class__.__name__
+
+        async def sender():
+            for object_guid in targets:
+                if object_guid in done:
+                    continue
+
+                try:
+                    # extra positional args would bind to text, only keywords are passed on
+                    result = await self.send_message(object_guid, text=text, file_inline=file_inline,
+                                                     type=type, **kwargs)
+                    entry = Results({'object_guid': object_guid, 'status': 'OK', 'result': result})
+
+                except Exception as exc:
+                    entry = Results({'object_guid': object_guid, 'status': type_name(exc), 'error': exc})
+
+                if log is not None:
+                    log.write(json.dumps({'object_guid': object_guid, 'status': entry['status']}) + '\n')
+                    log.flush()
+
+                await results.put(entry)
+                if delay:
+                    await asyncio.sleep(delay)
+
+        async def run():
+            try:
+                await asyncio.gather(*senders)
+            finally:
+                await results.put(None)
+
+        senders = [asyncio.create_task(sender()) for _ in range(max(1, concurrency))]
+        finished = asyncio.create_task(run())
+
+        try:
+            while True:
+                entry = await results.get()
+                if entry is None:
+                    break
+
+                yield entry
+
+            await finished
+
+        finally:
+            for task in (finished, *senders):
+                task.cancel()
+
+            if log is not None:
+                log.close()
@@ -1,4 +1,5 @@
 import rubpy
+from typing import Optional, Union
 from time import time
 
 
@@ -6,8 +7,11 @@ class GetMessagesUpdates:
     async def get_messages_updates(
             self: "rubpy.Client",
             object_guid: str,
-            state: int = round(time()) - 150,
+            state: Optional[Union[str, int]] = None,
     ):
+        if state is None:
+            state = round(time()) - 150
+
         return await self.builder('getMessagesUpdates',
                                   input=dict(
                                       object_guid=object_guid,
@@ -0,0 +1,149 @@
+from ...export import open_writer
+from typing import Any, Optional, Union
+import asyncio
+import json
+import os
+import rubpy
+
+
+class IterHistory:
+    async def iter_history(self: "rubpy.Client",
+                           object_guid: str,
+                           since: Optional[int] = None,
+                           until: Optional[int] = None,
+                           direction: str = 'backward',
+                           middle_message_id: Optional[Union[int, str]] = None,
+                           checkpoint: Optional[str] = None,
+                           output: Optional[Union[str, Any]] = None,
+                           prefetch: bool = True):
+        """_walk the history of a chat window by window_
+
+        Args:
+            object_guid (str):
+                _chat guid_.
+
+            since, until (int, optional):
+                _unix time bounds of the messages, both inclusive_. Defaults to None.
+
+            direction (str, optional):
+                _'backward' from newer to older messages or 'forward'_. Defaults to 'backward'.
+
+            middle_message_id (int, str, optional):
+                _message to start from, required to walk forward_. Defaults to the
+                last message of the chat.
+
+            checkpoint (str, optional):
+                _json file the last walked message is saved to, the walk resumes
+                from it_. Defaults to None.
+
+            output (str, writer, optional):
+                _every message is also written to this .db/.sqlite or ndjson file_. Defaults to None.
+
+            prefetch (bool, optional):
+                _request the next window while the current one is consumed_. Defaults to True.
+        """
+        if direction not in ('backward', 'forward'):
+            raise ValueError('The `direction` argument can only be in `("backward", "forward")`.')
+
+        backward = direction == 'backward'
+        # only ids past the boundary are new, so overlapping windows are dropped
+        # without remembering every id that was already yielded
+        boundary = None
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+
+            if state.get('object_guid') == object_guid and state.get('direction') == direction:
+                boundary = middle_message_id = int(state['message_id'])
+
+        if middle_message_id is None:
+            if not backward:
+                raise ValueError('`middle_message_id` is required to walk forward.')
+
+            info = await self.get_info(object_guid)
+            middle_message_id = info.find_keys('last_message_id') if info is not None else None
+            if middle_message_id is None:
+                return
+
+        writer = None
+        if output is not None:
+            writer = open_writer(output, table='messages', key='message_id',
+                                 mode='a' if boundary is not None else 'w')
+
+        # the first window surrounds the start message, only its side of the walk is kept,
+        # the start message included unless it was already yielded before a resume
+        inclusive = boundary is None
+        boundary = int(middle_message_id)
+
+        def fetch(message_id):
+            return asyncio.ensure_future(self.get_messages_interval(object_guid, message_id))
+
+        def save(message_id):
+            with open(checkpoint + '.tmp', 'w', encoding='utf-8') as file:
+                json.dump({'object_guid': object_guid, 'direction': direction,
+                           'message_id': str(message_id)}, file)
+            os.replace(checkpoint + '.tmp', checkpoint)
+
+        walked = None
+        next_window = fetch(middle_message_id)
+        try:
+            while next_window is not None:
+                result = await next_window
+                next_window = None
+
+                messages = sorted(result.find_keys('messages') or [],
+                                  key=lambda message: int(message.message_id), reverse=backward)
+                if inclusive:
+                    messages = [message for message in messages
+                                if int(message.message_id) == boundary
+                                or (int(message.message_id) < boundary) == backward]
+                    inclusive = False
+
+                else:
+                    messages = [message for message in messages
+                                if (int(message.message_id) < boundary) == backward
+                                and int(message.message_id) != boundary]
+
+                if not messages:
+                    break
+
+                last = messages[-1]
+                finished = (since is not None and backward and int(last.time or 0) < since
+                            or until is not None and not backward and int(last.time or 0) > until)
+                if not finished:
+                    next_window = fetch(last.message_id) if prefetch else None
+
+                for message in messages:
+                    time = int(message.time or 0)
+                    if (since is not None and time < since) or (until is not None and time > until):
+                        continue
+
+                    if writer is not None:
+                        writer.write(message)
+
+                    walked = message.message_id
+                    yield message
+
+                boundary = walked = int(last.message_id)
+                if writer is not None:
+                    writer.flush()
+
+                if checkpoint is not None:
+                    save(boundary)
+
+                if not finished and next_window is None:
+                    next_window = fetch(last.message_id)
+
+        finally:
+            # a walk stopped in the middle of a window resumes after its last message
+            if checkpoint is not None and walked is not None:
+                save(walked)
+
+            if next_window is not None:
+                if next_window.done():
+                    next_window.cancelled() or next_window.exception()
+                else:
+                    next_window.cancel()
+
+            if writer is not None and writer is not output:
+                writer.close()
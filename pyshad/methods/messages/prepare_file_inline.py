@@ -0,0 +1,67 @@
+from ..utilities import thumbnail
+from aiofiles import open as aiopen
+from pathlib import Path
+from typing import Union
+from os import path
+import rubpy
+
+
+class PrepareFileInline:
+    async def prepare_file_inline(self: "rubpy.Client",
+                                  file_inline: Union[Path, bytes, str],
+                                  type: str = 'File',
+                                  thumb: bool = True, *args, **kwargs):
+        """_upload a file and build the file_inline of a message_
+
+        The result can be passed as file_inline to send_message any number
+        of times without uploading the file again.
+        """
+        if isinstance(file_inline, str):
+            if file_inline.startswith('http'):
+                async with self.connection.session.get(
+                        file_inline, headers={'user-agent': self.user_agent}) as result:
+                    if result.ok:
+                        file_name = file_inline.split('/')[-1]
+                        file_inline = await result.read()
+                        kwargs['file_name'] = kwargs.get('file_name',
+                                                         file_name if '.' in file_name else file_name+'.'+type)
+
+            else:
+                async with aiopen(file_inline, 'rb') as file:
+                    kwargs['file_name'] = kwargs.get(
+                        'file_name', path.basename(file_inline))
+                    file_inline = await file.read()
+
+        if type in ('Music', 'Voice'):
+            thumb = None
+
+        if thumb:
+            if type in ('Video', 'Gif'):
+                thumb = thumbnail.MediaThumbnail.from_video(file_inline)
+            elif type == 'Image':
+                thumb = thumbnail.MediaThumbnail.from_image(file_inline)
+            elif type == 'VideoMessage':
+                thumb = thumbnail.MediaThumbnail.from_video(file_inline)
+
+            if not hasattr(thumb, 'image'):
+                type = 'File'
+                thumb = None
+
+        file_inline = await self.upload(file_inline, *args, **kwargs)
+
+        if type == 'VideoMessage':
+            file_inline['is_round'] = True
+
+        file_inline['type'] = 'Video' if type == 'VideoMessage' else type
+        file_inline['time'] = kwargs.get('time', 1)
+        file_inline['width'] = kwargs.get('width', 200)
+        file_inline['height'] = kwargs.get('height', 200)
+        file_inline['music_performer'] = kwargs.get('performer', '')
+
+        if isinstance(thumb, thumbnail.ResultMedia):
+            file_inline['time'] = thumb.seconds
+            file_inline['width'] = thumb.width
+            file_inline['height'] = thumb.height
+            file_inline['thumb_inline'] = thumb.to_base64()
+
+        return file_inline
\ No newline at end of file
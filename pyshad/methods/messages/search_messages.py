@@ -0,0 +1,42 @@
+from ...search import SearchIndex
+from ...types import Results
+from typing import Iterable, List, Optional
+import rubpy
+
+
+class SearchMessages:
+    async def search_messages(self: "rubpy.Client",
+                              query: str,
+                              object_guids: Optional[Iterable[str]] = None,
+                              author_guid: Optional[str] = None,
+                              since: Optional[int] = None,
+                              until: Optional[int] = None,
+                              limit: int = 50,
+                              order: str = 'rank',
+                              phrase: bool = False) -> List[Results]:
+        """_search the local full text index, without an api call_
+
+        Args:
+            query (str):
+                _fts5 query, `word*` for a prefix and `"two words"` for a phrase_.
+
+            object_guids (Iterable[str], optional):
+                _only search these chats_. Defaults to all chats.
+
+            since, until (int, optional):
+                _unix time bounds of the messages_. Defaults to None.
+
+            order (str, optional):
+                _'rank' for the best match or 'time' for the newest first_. Defaults to 'rank'.
+
+            phrase (bool, optional):
+                _search query as one literal phrase_. Defaults to False.
+        """
+        if self.search_index is None:
+            raise ValueError('`search_index` is not set.')
+
+        if phrase:
+            query = SearchIndex.quote(query)
+
+        return self.search_index.search(query, object_guids=object_guids, author_guid=author_guid,
+                                        since=since, until=until, limit=limit, order=order)
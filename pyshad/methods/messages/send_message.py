@@ -1,13 +1,9 @@
 from ...types import Results
-from ..utilities import thumbnail
 from typing import Optional, Union
-from aiofiles import open as aiopen
 from asyncio import create_task
 from pathlib import Path
-from os import path
 from random import random
 import rubpy
-import aiohttp
 
 
 class SendMessage:
@@ -68,55 +64,8 @@ class SendMessage:
                 input['metadata'] = markdown.get('metadata')
                 input['text'] = markdown.get('text')
 
-        if file_inline:
-            if not isinstance(file_inline, Results):
-                if isinstance(file_inline, str):
-                    if file_inline.startswith('http'):
-                        async with aiohttp.ClientSession(headers={'user-agent': self.user_agent}) as cs:
-                            async with cs.get(file_inline) as result:
-                                if result.ok:
-                                    file_name = file_inline.split('/')[-1]
-                                    file_inline = await result.read()
-                                    kwargs['file_name'] = kwargs.get('file_name',
-                                                                     file_name if '.' in file_name else file_name+'.'+type)
-
-                    else:
-                        async with aiopen(file_inline, 'rb') as file:
-                            kwargs['file_name'] = kwargs.get(
-                                'file_name', path.basename(file_inline))
-                            file_inline = await file.read()
-
-                if type in ('Music', 'Voice'):
-                    thumb = None
-
-                if thumb:
-                    if type in ('Video', 'Gif'):
-                        thumb = thumbnail.MediaThumbnail.from_video(file_inline)
-                    elif type == 'Image':
-                        thumb = thumbnail.MediaThumbnail.from_image(file_inline)
-                    elif type == 'VideoMessage':
-                        thumb = thumbnail.MediaThumbnail.from_video(file_inline)
-
-                    if not hasattr(thumb, 'image'):
-                        type = 'File'
-                        thumb = None
-
-                file_inline = await self.upload(file_inline, *args, **kwargs)
-
-                if type == 'VideoMessage':
-                    file_inline['is_round'] = True
-
-                file_inline['type'] = 'Video' if type == 'VideoMessage' else type
-                file_inline['time'] = kwargs.get('time', 1)
-                file_inline['width'] = kwargs.get('width', 200)
-                file_inline['height'] = kwargs.get('height', 200)
-                file_inline['music_performer'] = kwargs.get('performer', '')
-
-                if isinstance(thumb, thumbnail.ResultMedia):
-                    file_inline['time'] = thumb.seconds
-                    file_inline['width'] = thumb.width
-                    file_inline['height'] = thumb.height
-                    file_inline['thumb_inline'] = thumb.to_base64()
+        if file_inline and not isinstance(file_inline, Results):
+            file_inline = await self.prepare_file_inline(file_inline, type, thumb, *args, **kwargs)
 
         if file_inline:
             file_inline['is_spoil'] = bool(is_spoil)
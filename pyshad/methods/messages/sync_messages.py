@@ -0,0 +1,70 @@
+from ...store import CHATS_STATE, MessageStore
+from typing import Iterable, Optional
+from time import time
+import asyncio
+import rubpy
+
+
+class SyncMessages:
+    async def sync_messages(self: "rubpy.Client",
+                            object_guids: Optional[Iterable[str]] = None,
+                            store: Optional[MessageStore] = None,
+                            concurrency: int = 4) -> dict:
+        """_fetch what changed since the last sync into the message store_
+
+        Args:
+            object_guids (Iterable[str], optional):
+                _chats to sync, by default the chats getChatsUpdates reports
+                as changed since the stored chat list state_. Defaults to None.
+
+            store (MessageStore, optional):
+                _defaults to the client message_store_.
+
+            concurrency (int, optional):
+                _how many chats are synced at the same time_. Defaults to 4.
+
+        Returns:
+            dict: _chats synced and messages changed_.
+        """
+        store = store or self.message_store
+        if store is None:
+            raise ValueError('`message_store` is not set.')
+
+        chats, chats_state = {}, None
+        if object_guids is None:
+            result = await self.get_chats_updates(store.state(CHATS_STATE))
+            for chat in result.find_keys('chats') or []:
+                chats[chat.object_guid] = chat
+
+            chats_state = result.new_state
+
+        else:
+            chats = dict.fromkeys(object_guids)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def sync(object_guid, chat):
+            async with semaphore:
+                state = store.state(object_guid)
+                if state is not None:
+                    result = await self.get_messages_updates(object_guid, state)
+                    changed = store.apply(result.find_keys('updated_messages') or [])
+                    store.set_state(object_guid, result.new_state)
+                    return changed
+
+                # first sync of this chat, start from the window around its last message
+                last_message = getattr(chat, 'last_message', None) if chat is not None else None
+                message_id = getattr(last_message, 'message_id', None) if last_message is not None else None
+                if message_id is None:
+                    store.set_state(object_guid, round(time()) - 150)
+                    return 0
+
+                result = await self.get_messages_interval(object_guid, message_id)
+                changed = store.add_messages(object_guid, result.find_keys('messages') or [])
+                store.set_state(object_guid, result.state or round(time()))
+                return changed
+
+        changed = await asyncio.gather(*(sync(object_guid, chat) for object_guid, chat in chats.items()))
+        # only move the chat list cursor once every chat it reported is stored
+        store.set_state(CHATS_STATE, chats_state)
+        return {'chats': len(chats), 'messages': sum(changed)}
@@ -1,29 +1,19 @@
-from .setup_two_step_verification import SetupTwoStepVerification
-from .get_two_passcode_status import GetTwoPasscodeStatus
-from .get_privacy_setting import GetPrivacySetting
-from .get_blocked_users import GetBlockedUsers
-from .terminate_session import TerminateSession
-from .get_my_sessions import GetMySessions
-from .delete_folder import DeleteFolder
-from .get_folders import GetFolders
-from .get_suggested_folders import GetSuggestedFolders
-from .set_setting import SetSetting
-from .update_profile import UpdateProfile
-from .update_username import UpdateUsername
+from .. import lazy_module_getattr
 
+# mixin classes in the order Settings inherits them, and their modules
+MIXINS = {
+    'SetupTwoStepVerification': 'setup_two_step_verification',
+    'GetTwoPasscodeStatus': 'get_two_passcode_status',
+    'GetPrivacySetting': 'get_privacy_setting',
+    'GetBlockedUsers': 'get_blocked_users',
+    'TerminateSession': 'terminate_session',
+    'GetMySessions': 'get_my_sessions',
+    'DeleteFolder': 'delete_folder',
+    'GetFolders': 'get_folders',
+    'GetSuggestedFolders': 'get_suggested_folders',
+    'SetSetting': 'set_setting',
+    'UpdateProfile': 'update_profile',
+    'UpdateUsername': 'update_username',
+}
 
-class Settings(
-    SetupTwoStepVerification,
-    GetTwoPasscodeStatus,
-    GetPrivacySetting,
-    GetBlockedUsers,
-    TerminateSession,
-    GetMySessions,
-    DeleteFolder,
-    GetFolders,
-    GetSuggestedFolders,
-    SetSetting,
-    UpdateProfile,
-    UpdateUsername,
-):
-    pass
\ No newline at end of file
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Settings', MIXINS)
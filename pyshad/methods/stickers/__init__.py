@@ -1,19 +1,19 @@
-from .get_my_sticker_sets import GetMyStickerSets
-from .action_on_sticker_set import ActionOnStickerSet
-from .get_sticker_set_by_id import GetStickerSetByID
-from .get_stickers_by_emoji import GetStickersByEmoji
-from .get_stickers_by_set_ids import GetStickersBySetIDs
-from .get_trend_sticker_sets import GetTrendStickerSets
-from .search_stickers import SearchStickers
+from .. import lazy_module_getattr
 
+# mixin classes in the order Stickers inherits them, and their modules
+MIXINS = {
+    'GetMyStickerSets': 'get_my_sticker_sets',
+    'ActionOnStickerSet': 'action_on_sticker_set',
+    'GetStickerSetByID': 'get_sticker_set_by_id',
+    'GetStickersByEmoji': 'get_stickers_by_emoji',
+    'GetStickersBySetIDs': 'get_stickers_by_set_ids',
+    'GetTrendStickerSets': 'get_trend_sticker_sets',
+    'SearchStickers': 'search_stickers',
+}
 
-class Stickers(
-    GetMyStickerSets,
-    ActionOnStickerSet,
-    GetStickerSetByID,
-    GetStickersByEmoji,
-    GetStickersBySetIDs,
-    GetTrendStickerSets,
-    SearchStickers,
-):
-    pass
\ No newline at end of file
+# modules whose methods are not named after the module
+NAMES = {
+    'get_stickers_by_set_ids': ('GetStickersBySetIDs',),
+}
+
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Stickers', MIXINS)
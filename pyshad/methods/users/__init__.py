@@ -1,15 +1,12 @@
-from .get_user_info import GetUserInfo
-from .get_me import GetMe
-from .set_block_user import SetBlockUser
-from .delete_user_chat import DeleteUserChat
-from .check_user_username import CheckUserUsername
+from .. import lazy_module_getattr
 
+# mixin classes in the order Users inherits them, and their modules
+MIXINS = {
+    'GetUserInfo': 'get_user_info',
+    'GetMe': 'get_me',
+    'SetBlockUser': 'set_block_user',
+    'DeleteUserChat': 'delete_user_chat',
+    'CheckUserUsername': 'check_user_username',
+}
 
-class Users(
-    GetUserInfo,
-    GetMe,
-    SetBlockUser,
-    DeleteUserChat,
-    CheckUserUsername,
-):
-    pass
\ No newline at end of file
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Users', MIXINS)
@@ -1,27 +1,20 @@
-from .start import Start
-from .connect import Connect
-from .disconnect import Disconnect
-from .add_handler import AddHandler
-from .remove_handler import RemoveHandler
-from .run import Run
-from .upload import UploadFile
-from .download import Download
-from .get_updates import GetUpdates
-from .download_profile_picture import DownloadProfilePicture
-from .get_members import GetMembers
+from .. import lazy_module_getattr
 
+# mixin classes in the order Utilities inherits them, and their modules
+MIXINS = {
+    'Start': 'start',
+    'Connect': 'connect',
+    'Disconnect': 'disconnect',
+    'AddHandler': 'add_handler',
+    'RemoveHandler': 'remove_handler',
+    'Run': 'run',
+    'UploadFile': 'upload',
+    'Download': 'download',
+    'GetUpdates': 'get_updates',
+    'DownloadProfilePicture': 'download_profile_picture',
+    'GetMembers': 'get_members',
+    'IterMembers': 'iter_members',
+    'ExportMembers': 'export_members',
+}
 
-class Utilities(
-    Start,
-    Connect,
-    Disconnect,
-    AddHandler,
-    RemoveHandler,
-    Run,
-    UploadFile,
-    Download,
-    GetUpdates,
-    DownloadProfilePicture,
-    GetMembers,
-):
-    pass
\ No newline at end of file
+__getattr__, __dir__ = lazy_module_getattr(globals(), 'Utilities', MIXINS)
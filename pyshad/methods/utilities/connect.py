@@ -12,7 +12,11 @@ class Connect:
             except:
                 print("Warning -> Failed to get_me")
 
-        information = self.session.information()
+        # sessions with an async api read off the event loop thread
+        if hasattr(self.session, 'ainformation'):
+            information = await self.session.ainformation()
+        else:
+            information = self.session.information()
         #self.logger.info(f'the session information was read {information}')
 
         if information:
@@ -0,0 +1,78 @@
+from ...export import open_writer, to_dict
+from typing import Any, Iterable, Optional, Union
+import asyncio
+import string
+import time
+import rubpy
+
+# search_text values the member list is split into, every member whose name
+# contains one of them is found by at least one partition
+DEFAULT_PARTITIONS = tuple(string.ascii_lowercase + string.digits + 'آابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی')
+
+
+class ExportMembers:
+    async def export_members(self: "rubpy.Client",
+                             object_guid: str,
+                             output: Union[str, Any],
+                             partitions: Optional[Iterable[str]] = None,
+                             concurrency: int = 8,
+                             complete: bool = False) -> dict:
+        """_export the members of a group or channel_
+
+        Args:
+            object_guid (str):
+                _group or channel guid_.
+
+            output (str, writer):
+                _.db/.sqlite file, any other path is written as ndjson_.
+
+            partitions (Iterable[str], optional):
+                _search_text values walked in parallel_. Defaults to DEFAULT_PARTITIONS.
+
+            concurrency (int, optional):
+                _how many partitions are walked at the same time, requests
+                still go through the client rate limiter_. Defaults to 8.
+
+            complete (bool, optional):
+                _also walk the unfiltered list so members whose name matches
+                no partition are exported too_. Defaults to False.
+
+        Returns:
+            dict: _members, duplicates, partitions and elapsed seconds_.
+        """
+        started = time.monotonic()
+        queue = list(DEFAULT_PARTITIONS if partitions is None else partitions)
+        if complete and '' not in queue:
+            # the full walk is the longest one, start it first
+            queue.insert(0, '')
+
+        pending = iter(queue)
+        seen = set()
+        stats = {'members': 0, 'duplicates': 0, 'partitions': len(queue)}
+        writer = open_writer(output, table='members', key='member_guid')
+
+        async def worker():
+            for search_text in pending:
+                async for member in self.iter_members(object_guid, search_text=search_text):
+                    member_guid = getattr(member, 'member_guid', None)
+                    if member_guid in seen:
+                        stats['duplicates'] += 1
+                        continue
+
+                    seen.add(member_guid)
+                    writer.write(to_dict(member))
+                    stats['members'] += 1
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, min(concurrency, len(queue))))]
+        try:
+            await asyncio.gather(*workers)
+
+        finally:
+            for task in workers:
+                task.cancel()
+
+            if writer is not output:
+                writer.close()
+
+        stats['elapsed'] = time.monotonic() - started
+        return stats
@@ -0,0 +1,18 @@
+from ...paginator import paginate
+from typing import Optional
+import rubpy
+
+
+class IterMembers:
+    async def iter_members(
+            self: "rubpy.Client",
+            object_guid: str,
+            search_text: str = '',
+            limit: Optional[int] = None,
+            start_id: Optional[str] = None,
+    ):
+        async def fetch(start_id):
+            return await self.get_members(object_guid, start_id=start_id, search_text=search_text)
+
+        async for member in paginate(fetch, 'in_chat_members', limit=limit, start_id=start_id):
+            yield member
@@ -59,12 +59,16 @@ class Start:
                     self.auth = result.auth
                     self.decode_auth = Crypto.decode_auth(self.auth)
                     self.import_key = pkcs1_15.new(RSA.import_key(self.private_key.encode())) if self.private_key is not None else None
-                    self.session.insert(
-                        auth=self.auth,
-                        guid=result.user.user_guid,
-                        user_agent=self.user_agent,
-                        phone_number=result.user.phone,
-                        private_key=self.private_key)
+                    information = dict(auth=self.auth,
+                                       guid=result.user.user_guid,
+                                       user_agent=self.user_agent,
+                                       phone_number=result.user.phone,
+                                       private_key=self.private_key)
+                    # sessions with an async api write off the event loop thread
+                    if hasattr(self.session, 'ainsert'):
+                        await self.session.ainsert(**information)
+                    else:
+                        self.session.insert(**information)
 
                     await self.register_device()
                     break
@@ -4,19 +4,28 @@ import tempfile
 import warnings
 import io
 
-try:
-    import cv2
-    import numpy as np
 
-except ImportError as e:
-    cv2 = None
-    numpy = None
+# opencv, numpy and pillow take long to import, they are only loaded
+# the first time a thumbnail is made
+def load_cv2():
+    try:
+        import cv2
+        import numpy as np
 
-try:
-    import PIL.Image
+    except ImportError:
+        return None, None
 
-except ImportError as e:
-    PIL = None
+    return cv2, np
+
+
+def load_pil():
+    try:
+        import PIL.Image
+
+    except ImportError:
+        return None
+
+    return PIL.Image
 
 
 class ResultMedia:
@@ -33,6 +42,7 @@ class ResultMedia:
         self.height = height
         self.seconds = seconds
 
+        cv2, np = load_cv2()
         if hasattr(cv2, 'imdecode'):
             if not isinstance(image, np.ndarray):
                 image = np.frombuffer(image, dtype=np.uint8)
@@ -41,6 +51,7 @@ class ResultMedia:
             self.image = self.ndarray_to_bytes(image)
 
     def ndarray_to_bytes(self, image, *args, **kwargs) -> str:
+        cv2, _ = load_cv2()
         if hasattr(cv2, 'resize'):
             self.width = image.shape[1]
             self.height = image.shape[0]
@@ -60,13 +71,15 @@ class MediaThumbnail:
     @classmethod
     def from_image(cls, image: bytes) -> ResultMedia:
         # Check if PIL is avaliable
-        if PIL is not None:
-            image, output = PIL.Image.open(io.BytesIO(image)), io.BytesIO()
+        Image = load_pil()
+        if Image is not None:
+            image, output = Image.open(io.BytesIO(image)), io.BytesIO()
             width, height = image.size
             image.save(output, format='PNG')
             return ResultMedia(output.getvalue(), width=width, height=height)
 
         # Check if OpenCV and NumPy are available
+        cv2, np = load_cv2()
         if cv2 is None or np is None:
             warnings.warn('OpenCV or NumPy not found, image processing disabled')
             return None
@@ -88,6 +101,7 @@ class MediaThumbnail:
     @classmethod
     def from_video(cls, video: bytes) -> typing.Optional[ResultMedia]:
         # Check if OpenCV is available
+        cv2, _ = load_cv2()
         if cv2 is None:
             warnings.warn('OpenCV not found, video processing disabled')
             return None
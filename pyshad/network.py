@@ -4,9 +4,14 @@ import rubpy
 import aiofiles
 import json
 import os
+import time
+from typing import Optional
 from .crypto import Crypto
+from .endpoints import EndpointManager
+from . import deadline as deadlines
 from . import exceptions
 from .types import Results
+from .export import to_dict
 
 def capitalize(text: str):
     return ''.join([c.title() for c in text.split('_')])
@@ -22,72 +27,118 @@ class Network:
 
     def __init__(self, client: "rubpy.Client") -> None:
         self.client = client
-        connector = aiohttp.TCPConnector(verify_ssl=False)
+        self.pool = client.pool
         self.json_decoder = json.JSONDecoder().decode
         self.json_encoder = json.JSONEncoder().encode
-        self.session = aiohttp.ClientSession(
-            connector=connector,
-            headers=self.HEADERS,
-            timeout=aiohttp.ClientTimeout(client.timeout),
-        )
+        self.timeout = aiohttp.ClientTimeout(client.timeout)
 
         if client.bot_token is not None:
             self.bot_api_url = f'https://messengerg2b1.iranlms.ir/v3/{client.bot_token}/'
 
-        self.api_url = None
-        self.wss_url = None
+        self.endpoints = client.endpoints or EndpointManager(store=client.session,
+                                                             cache_path=client.dc_cache_path,
+                                                             cache_ttl=client.dc_cache_ttl)
+        self.dcs_loaded = False
+        # resume cursor, always a state the server returned, never the local clock
+        self.state = None
+        # object_guid -> (last_message_id, time) of the chats replay dispatched
+        self.chat_versions = {}
+        self.reconnects = 0
+        self.replay_errors = 0
+        self.transport = None
+        self.polls = 0
+        # seconds between two polls while active and while idle
+        self.poll_interval = (1, 30)
+        # failed socket connections in a row before polling, and for how long
+        self.socket_failures = 3
+        self.poll_duration = 300
+
+    @property
+    def api_url(self):
+        return self.endpoints.api_url if self.dcs_loaded else None
+
+    @property
+    def wss_url(self):
+        return self.endpoints.wss_url if self.dcs_loaded else None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self.pool.session
 
     async def close(self):
-        await self.session.close()
+        if self.client.endpoints is None:
+            await self.endpoints.close()
+        if self.client.own_pool:
+            await self.pool.close()
 
     async def get_dcs(self):
-        try_count = 0
-
-        while True:
-            try:
-                async with self.session.get("https://shgetdcmess.iranlms.ir/", verify_ssl=False) as response:
-                    if not response.ok:
-                        continue
-
-                    response = (await response.json()).get('data')
-
-                self.api_url = response.get('API').get(response.get('default_api')) + '/'
-                self.wss_url = response.get('socket').get(response.get('default_socket'))
-                return True
-
-            except aiohttp.ServerTimeoutError:
-                try_count += 1
-                print(f'Server timeout error ({try_count})')
-                await asyncio.sleep(try_count)
-                continue
+        await self.endpoints.discover(self.session)
+        self.dcs_loaded = True
+        return True
 
-            except aiohttp.ClientConnectionError:
-                try_count += 1
-                print(f'Client connection error ({try_count})')
-                await asyncio.sleep(try_count)
-                continue
-
-    async def request(self, url: str, data: dict):
+    async def request(self, url: str, data: dict, method: str = None, deadline: float = None):
         if not isinstance(data, str):
             data = self.json_encoder(data)
 
         if isinstance(data, str):
             data = data.encode('utf-8')
 
-        for _ in range(3):
-            try:
-                async with self.session.post(url=url, data=data, verify_ssl=False) as response:
-                    if response.ok:
-                        return self.json_decoder(await response.text())
+        policy = self.client.retry_policy
+        deadline = policy.call_deadline(deadline)
+        attempt = 0
 
-            except aiohttp.ServerTimeoutError:
-                print('Rubika server timeout error, try again ({})'.format(_))
+        while True:
+            remaining = policy.remaining(deadline)
+            if remaining is not None and remaining <= 0:
+                raise exceptions.RequestTimeout(f'{method or url} exceeded its deadline',
+                                                method=method, url=url, attempts=attempt)
 
-            except aiohttp.ClientError:
-                print('Client error, try again ({})'.format(_))
+            timeout = self.timeout
+            if remaining is not None:
+                timeout = aiohttp.ClientTimeout(min(remaining, timeout.total or remaining))
 
-            except Exception as err:
-                print('Unknown Error:', err, '{}'.format(_))
+            start = time.monotonic()
+            try:
+                async with self.session.post(url=url, data=data, timeout=timeout) as response:
+                    if response.ok:
+                        text = await response.text()
+                        try:
+                            result = self.json_decoder(text)
+
+                        except ValueError as exc:
+                            # a proxy error page, retried like any other failed attempt
+                            error = exceptions.InvalidResponse(
+                                'the server returned invalid json', method=method,
+                                url=url, attempts=attempt + 1)
+                            error.__cause__ = exc
+
+                        else:
+                            self.endpoints.report(url, time.monotonic() - start)
+                            return result
+
+                    else:
+                        error = exceptions.ServerUnavailable(
+                            f'the server returned {response.status} {response.reason}',
+                            method=method, url=url, attempts=attempt + 1, status=response.status)
+
+            except asyncio.TimeoutError as exc:
+                error = exceptions.RequestTimeout(f'{method or url} timed out',
+                                                  method=method, url=url, attempts=attempt + 1)
+                error.__cause__ = exc
+
+            except aiohttp.ClientError as exc:
+                error = exceptions.NetworkError(f'{exc.__class__.__name__}: {exc}',
+                                                method=method, url=url, attempts=attempt + 1)
+                error.__cause__ = exc
+
+            self.endpoints.report(url)
+            if not policy.should_retry(method, error, attempt) or not await policy.sleep(attempt, deadline):
+                raise error
+
+            attempt += 1
+            # move to the best ranked api host if this one is failing
+            if self.endpoints.find(url) in self.endpoints.apis.values():
+                url = self.endpoints.api_url
 
     async def send(self, **kwargs):
         api_version: str = str(kwargs.get('api_version', self.client.API_VERSION))
@@ -98,6 +149,7 @@ class Network:
         encrypt: bool = kwargs.get('encrypt', True)
         tmp_session: bool = kwargs.get('tmp_session', False)
         url: str = kwargs.get('url', self.api_url)
+        deadline: float = kwargs.get('deadline', deadlines.current())
 
         data = dict(
             api_version=api_version,
@@ -109,6 +161,7 @@ class Network:
         else:
             data['auth'] = self.client.decode_auth
         if api_version == '6':
+            deadlines.check(deadline, method)
             data_enc = dict(
                 client=client,
                 method=method,
@@ -120,7 +173,7 @@ class Network:
 
             if tmp_session is False:
                 data['sign'] = Crypto.makeSignFromData(private_key=self.client.private_key, data_enc=data['data_enc'])
-            return await self.request(url, data=data)
+            return await self.request(url, data=data, method=method, deadline=deadline)
 
         elif api_version == '0':
             data['auth'] = auth
@@ -136,10 +189,72 @@ class Network:
             return await self.request(
                 url=self.bot_api_url + method,
                 data=input,
+                method=method,
+                deadline=deadline,
             )
 
 
-        return await self.request(url, data=data)
+        return await self.request(url, data=data, method=method, deadline=deadline)
+
+    async def dispatch(self, name: str, package: list, user_guid: str = None) -> int:
+        if not isinstance(package, list):
+            return 0
+
+        if self.client.dedup is not None:
+            package = [update for update in package
+                       if not isinstance(update, dict) or not self.client.dedup.seen(update)]
+            if not package:
+                return 0
+
+        for listener in self.client.update_listeners:
+            listener(name, package, user_guid)
+
+        for update in package:
+            update['client'] = self.client
+            update['user_guid'] = user_guid
+
+        if name == 'chat_updates' and self.client.cache is not None:
+            for update in package:
+                self.client.cache.invalidate(update.get('object_guid'))
+
+        if name == 'message_updates':
+            for store in (self.client.message_store, self.client.search_index):
+                if store is not None:
+                    store.apply(package)
+
+        for update in package:
+            for func, handler in self.client.handlers.items():
+                try:
+                    # if handler is empty filters
+                    if isinstance(handler, type):
+                        handler = handler()
+
+                    else:
+                        # func runs later, so every update needs its own handler object
+                        handler = self.copy_handler(handler)
+
+                    if handler.__name__ != capitalize(name):
+                        continue
+
+                    # analyze handlers
+                    if not await handler(update=update):
+                        continue
+
+                    asyncio.create_task(func(handler))
+
+                except exceptions.StopHandler:
+                    break
+
+                except Exception:
+                    pass
+
+        return len(package)
+
+    @staticmethod
+    def copy_handler(handler):
+        result = handler.__class__.__new__(handler.__class__)
+        result.__dict__.update(handler.__dict__)
+        return result
 
     async def update_handler(self, update: dict):
         if isinstance(update, str):
@@ -150,71 +265,163 @@ class Network:
         if data_enc:
             result = Crypto.decrypt(data_enc, key=self.client.key)
             user_guid = result.pop('user_guid')
+            state = result.pop('new_state', None) or result.pop('state', None)
+            if isinstance(state, (int, str)) and str(state).isdigit():
+                self.state = int(state)
 
-            async def complete(name, package):
-                if not isinstance(package, list):
-                    return
-
-                for update in package:
-                    update['client'] = self.client
-                    update['user_guid'] = user_guid
-
-                for func, handler in self.client.handlers.items():
-                    try:
-                        # if handler is empty filters
-                        if isinstance(handler, type):
-                            handler = handler()
-
-                        if handler.__name__ != capitalize(name):
-                            return
+            for name, package in result.items():
+                asyncio.create_task(self.dispatch(name, package, user_guid))
+                # self._client._logger.error(
+                #     'handler raised an exception', extra={'data': update}, exc_info=True)
+
+    async def sync_state(self) -> None:
+        """Take the current state from the server as the resume cursor."""
+        result = await self.client.get_chats_updates()
+        if result.new_state is not None:
+            self.state = int(result.new_state)
+
+    @staticmethod
+    def chat_version(chat: dict) -> tuple:
+        last_message = chat.get('last_message') or {}
+        return last_message.get('message_id'), chat.get('time'), chat.get('last_message_id')
+
+    async def replay(self, state: Optional[int]) -> int:
+        """Dispatch the updates sent since state and return how many were new."""
+        result = await self.client.get_chats_updates(state)
+        chats = []
+        for chat in result.find_keys('chats') or []:
+            chat = to_dict(chat)
+            # the same chat comes back until the cursor moves past it, dispatch it once
+            version = self.chat_version(chat)
+            if self.chat_versions.get(chat.get('object_guid')) != version:
+                self.chat_versions[chat.get('object_guid')] = version
+                chats.append(chat)
+
+        count = 0
+        if chats:
+            # built from the chat list, not sent by the server, handlers can tell by synthetic
+            count += await self.dispatch('chat_updates', [{'object_guid': chat.get('object_guid'),
+                                                           'action': 'Edit', 'chat': chat,
+                                                           'updated_parameters': [],
+                                                           'synthetic': True} for chat in chats],
+                                         self.client.guid)
+
+        for chat in chats:
+            updates = await self.client.get_messages_updates(chat.get('object_guid'), state)
+            count += await self.dispatch('message_updates',
+                                         [to_dict(update) for update in
+                                          updates.find_keys('updated_messages') or []],
+                                         self.client.guid)
+
+        if result.new_state is not None:
+            self.state = int(result.new_state)
+        return count
+
+    async def poll_updates(self, duration: float = None):
+        """Poll for updates instead of the socket, for duration seconds or forever.
+
+        The interval shrinks to the minimum while updates arrive and
+        doubles up to the maximum while the account is idle.
+        """
+        min_interval, max_interval = self.poll_interval
+        interval = min_interval
+        stop = None if duration is None else time.monotonic() + duration
+        while stop is None or time.monotonic() < stop:
+            try:
+                # only updates that were new to the handlers count as activity
+                active = await self.replay(self.state)
 
-                        # analyze handlers
-                        if not await handler(update=update):
-                            return
+            except asyncio.CancelledError:
+                raise
 
-                        asyncio.create_task(func(handler))
+            except Exception:
+                self.replay_errors += 1
+                active = False
 
-                    except exceptions.StopHandler:
-                        break
+            self.polls += 1
+            interval = min_interval if active else min(max_interval, interval * 2)
+            await asyncio.sleep(interval if stop is None else max(0, min(interval, stop - time.monotonic())))
 
-                    except Exception:
-                        pass
+    async def get_updates(self):
+        if not self.dcs_loaded:
+            await self.get_dcs()
 
-            for name, package in result.items():
-                asyncio.create_task(complete(name, package))
-                        # self._client._logger.error(
-                        #     'handler raised an exception', extra={'data': update}, exc_info=True)
+        if self.client.update_transport == 'polling':
+            self.transport = 'polling'
+            return await self.poll_updates()
 
-    async def get_updates(self):
+        attempt = 0
         while True:
+            if self.client.update_transport == 'auto' and attempt >= self.socket_failures:
+                # the socket keeps failing, maybe a proxy kills it, poll for a while
+                self.transport = 'polling'
+                await self.poll_updates(self.poll_duration)
+                attempt = 0
+
+            self.transport = 'websocket'
+            wss_url = self.wss_url
+            connected = time.monotonic()
             try:
-                async with self.session.ws_connect(self.wss_url, verify_ssl=False, heartbeat=30) as ws:
+                async with self.session.ws_connect(wss_url, heartbeat=30) as ws:
                     await self.send_json_to_ws(ws)
-                    asyncio.create_task(self.send_json_to_ws(ws, data=True))
+                    keepalive = asyncio.create_task(self.send_json_to_ws(ws, data=True))
+                    if self.state is None:
+                        asyncio.create_task(self.catch_up(None))
+
+                    else:
+                        asyncio.create_task(self.catch_up(self.state))
 
-                    async for msg in ws:
-                        if msg.type == aiohttp.WSMsgType.TEXT:
-                            asyncio.create_task(self.update_handler(msg.data))
-                        elif msg.type == aiohttp.WSMsgType.CLOSED:
-                            break
-                        elif msg.type == aiohttp.WSMsgType.ERROR:
-                            break
+                    try:
+                        async for msg in ws:
+                            connected = None
+                            if msg.type == aiohttp.WSMsgType.TEXT:
+                                asyncio.create_task(self.update_handler(msg.data))
+                            elif msg.type == aiohttp.WSMsgType.CLOSED:
+                                break
+                            elif msg.type == aiohttp.WSMsgType.ERROR:
+                                break
+
+                    finally:
+                        keepalive.cancel()
 
             except aiohttp.ClientError:
-                continue
+                self.endpoints.report(wss_url)
+
+            except asyncio.CancelledError:
+                raise
 
             except Exception:
-                continue
+                pass
+
+            # a socket that delivered messages or stayed up a while was healthy
+            if connected is None or time.monotonic() - connected > 60:
+                attempt = 0
+
+            self.reconnects += 1
+            await asyncio.sleep(self.client.retry_policy.delay(attempt))
+            attempt += 1
+
+    async def catch_up(self, state: Optional[int]):
+        try:
+            # the first connection has nothing to catch up on, only a cursor to take
+            if state is None:
+                await self.sync_state()
+            else:
+                await self.replay(state)
+
+        except Exception:
+            self.replay_errors += 1
 
     async def send_json_to_ws(self, ws: aiohttp.ClientWebSocketResponse, data=False):
         if data:
-            while True:
+            while not ws.closed:
+                await asyncio.sleep(10)
                 try:
-                    await asyncio.sleep(10)
                     await ws.send_json({})
-                    await self.client.get_chats_updates()
-                except:
-                    pass
+                except Exception:
+                    return
+
+            return
 
         return await ws.send_json(dict(
             method='handShake',
@@ -258,6 +465,7 @@ class Network:
             try:
                 result = await self.session.post(
                         upload_url,
+                        timeout=self.timeout,
                         headers={
                             'auth': self.client.auth,
                             'file-id': id,
@@ -704,14 +912,8 @@ class Network:
                          "450": "https://shst450.iranlms.ir/GetFile.ashx",
                          "451": "https://shst451.iranlms.ir/GetFile.ashx",
                          "452": "https://shst452.iranlms.ir/GetFile.ashx",
-                         "453": "https://shst453.iranlms.ir/GetFile.ashx"},
-            "default_api_urls": ["https://shadmessenger162.iranlms.ir", "https://shadmessenger75.iranlms.ir",
-                                 "https://shadmessenger28.iranlms.ir"],
-            "default_sockets": ["wss://shsocket8.iranlms.ir:80", "wss://shsocket4.iranlms.ir:80",
-                                "wss://shsocket11.iranlms.ir:80"],
-            "default_bot_urls": ["https://shadmessenger6.iranlms.ir", "https://shadmessenger3.iranlms.ir",
-                                 "https://shadmessenger7.iranlms.ir"]}
-        url = hosts['storages'][dc_id]
+                         "453": "https://shst453.iranlms.ir/GetFile.ashx"}}
+        url = self.endpoints.storages.get(str(dc_id)) or hosts['storages'][str(dc_id)]
         start_index = 0
         result = b''
 
@@ -722,14 +924,13 @@ class Network:
             'user-agent': self.client.user_agent
         }
 
-        async with aiohttp.ClientSession() as session:
-            while True:
-                last_index = start_index + chunk - 1 if start_index + chunk < size else size - 1
+        while True:
+            last_index = start_index + chunk - 1 if start_index + chunk < size else size - 1
 
-                headers['start-index'] = str(start_index)
-                headers['last-index'] = str(last_index)
+            headers['start-index'] = str(start_index)
+            headers['last-index'] = str(last_index)
 
-                response = await session.post(url, headers=headers)
+            async with self.session.post(url, headers=headers, timeout=self.timeout) as response:
                 if response.ok:
                     data = await response.read()
                     if data:
@@ -738,11 +939,11 @@ class Network:
                         if callback:
                             await callback(size, len(result))
 
-                # Check for the end of the file
-                if len(result) >= size:
-                    break
+            # Check for the end of the file
+            if len(result) >= size:
+                break
 
-                # Update the start_index value to fetch the next part of the file
-                start_index = last_index + 1
+            # Update the start_index value to fetch the next part of the file
+            start_index = last_index + 1
 
         return result
\ No newline at end of file
@@ -0,0 +1,56 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+
+def page_items(page: Any, key: str) -> list:
+    if page is None:
+        return []
+
+    items = page.find_keys(key) if hasattr(page, 'find_keys') else getattr(page, key, None)
+    return items or []
+
+
+async def paginate(fetch: Callable[[Optional[str]], Awaitable[Any]],
+                   key: str,
+                   limit: Optional[int] = None,
+                   start_id: Optional[str] = None,
+                   prefetch: bool = True) -> AsyncIterator[Any]:
+    """Walk a cursor based list method and yield the items of every page.
+
+    fetch is called with the start_id of the next page; while the items of
+    one page are consumed the next page is already requested.
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    count = 0
+    next_page: Optional[asyncio.Future] = asyncio.ensure_future(fetch(start_id))
+
+    try:
+        while next_page is not None:
+            page = await next_page
+            next_page = None
+
+            next_start_id = getattr(page, 'next_start_id', None)
+            has_next = (bool(getattr(page, 'has_continue', False))
+                        and next_start_id is not None and next_start_id != start_id)
+            if has_next:
+                start_id = next_start_id
+                if prefetch:
+                    next_page = asyncio.ensure_future(fetch(start_id))
+
+            for item in page_items(page, key):
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+            if has_next and next_page is None:
+                next_page = asyncio.ensure_future(fetch(start_id))
+
+    finally:
+        if next_page is not None:
+            if next_page.done():
+                next_page.cancelled() or next_page.exception()
+            else:
+                next_page.cancel()
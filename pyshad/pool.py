@@ -0,0 +1,98 @@
+import time
+from typing import Optional
+
+import aiohttp
+
+
+class ConnectionPool:
+    def __init__(self,
+                 limit: int = 100,
+                 limit_per_host: int = 0,
+                 dns_cache_ttl: Optional[int] = 300,
+                 keepalive_timeout: float = 30,
+                 timeout: Optional[int] = 20,
+                 headers: Optional[dict] = None) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.headers = headers
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.queued_time = 0.0
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                ssl=False,
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                use_dns_cache=self.dns_cache_ttl is not None,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(self.timeout),
+                trace_configs=[self.trace_config()],
+            )
+
+        return self._session
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        async def on_request_end(session, context, params):
+            self.in_flight -= 1
+
+        async def on_connection_queued_start(session, context, params):
+            context.queued_at = time.monotonic()
+
+        async def on_connection_queued_end(session, context, params):
+            self.queued_time += time.monotonic() - context.queued_at
+
+        async def on_connection_create_end(session, context, params):
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self.connections_reused += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_end)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def stats(self) -> dict:
+        connections = self.connections_created + self.connections_reused
+        return {
+            'limit': self.limit,
+            'limit_per_host': self.limit_per_host,
+            'requests': self.requests,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'utilization': min(self.in_flight, self.limit) / self.limit if self.limit else 0.0,
+            'connections_created': self.connections_created,
+            'connections_reused': self.connections_reused,
+            'reuse_ratio': self.connections_reused / connections if connections else 0.0,
+            'queued_time': self.queued_time,
+        }
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,180 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# status_det values that mean the server wants us to slow down
+THROTTLE_STATUS = frozenset({'TOO_REQUESTS', 'ERROR_TRY_AGAIN'})
+
+METHOD_CLASSES = {
+    'send': {'sendMessage', 'forwardMessages', 'editMessage', 'createPoll',
+             'deleteMessages', 'actionOnMessageReaction', 'setPinMessage'},
+    'members': {'addGroupMembers', 'addChannelMembers', 'banGroupMember',
+                'banChannelMember', 'setGroupAdmin', 'addAddressBook'},
+    'join': {'joinGroup', 'joinChannelByLink', 'joinChannelAction',
+             'leaveGroup', 'addGroup', 'addChannel'},
+    'upload': {'requestSendFile', 'uploadAvatar'},
+}
+
+# requests per second and burst size of each method class
+DEFAULT_RATES = {
+    'send': (5, 10),
+    'members': (1, 3),
+    'join': (0.5, 2),
+    'upload': (5, 10),
+    'default': (20, 40),
+}
+
+# the same limits, applied to every target object_guid
+DEFAULT_TARGET_RATES = {
+    'send': (1, 3),
+    'members': (1, 3),
+}
+
+TARGET_KEYS = ('object_guid', 'to_object_guid', 'group_guid', 'channel_guid')
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = rate / 32
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    @property
+    def idle(self) -> bool:
+        self.refill()
+        return self.tokens >= self.capacity and not self._lock.locked()
+
+    async def acquire(self) -> float:
+        waited = 0.0
+        # the lock keeps waiting callers in fifo order
+        async with self._lock:
+            while True:
+                self.refill()
+                delay = max(self.blocked_until - time.monotonic(),
+                            (1 - self.tokens) / self.rate if self.tokens < 1 else 0)
+                if delay <= 0:
+                    self.tokens -= 1
+                    return waited
+
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def penalize(self, backoff: float) -> None:
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = min(self.tokens, 0)
+        self.blocked_until = max(self.blocked_until, time.monotonic() + backoff)
+
+    def reward(self) -> None:
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class RateLimiter:
+    def __init__(self,
+                 rates: Optional[Dict[str, Tuple[float, float]]] = None,
+                 target_rates: Optional[Dict[str, Tuple[float, float]]] = None,
+                 max_retries: int = 5,
+                 max_backoff: float = 60,
+                 max_targets: int = 10000) -> None:
+        self.rates = dict(DEFAULT_RATES, **(rates or {}))
+        self.target_rates = dict(DEFAULT_TARGET_RATES, **(target_rates or {}))
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self.max_targets = max_targets
+        self.classes = {name: kind for kind, names in METHOD_CLASSES.items() for name in names}
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.targets: "OrderedDict[Tuple[str, str], TokenBucket]" = OrderedDict()
+        self.throttled_calls = 0
+        self.throttled_time = 0.0
+        self.throttled_time_by_class: Dict[str, float] = {}
+        self.retries = 0
+
+    def method_class(self, name: str) -> str:
+        return self.classes.get(name, 'default')
+
+    @staticmethod
+    def target(input: Optional[dict]) -> Optional[str]:
+        for key in TARGET_KEYS:
+            value = (input or {}).get(key)
+            if isinstance(value, str):
+                return value
+
+    def bucket(self, kind: str) -> TokenBucket:
+        bucket = self.buckets.get(kind)
+        if bucket is None:
+            bucket = self.buckets[kind] = TokenBucket(*self.rates.get(kind, self.rates['default']))
+        return bucket
+
+    def target_bucket(self, kind: str, input: Optional[dict]) -> Optional[TokenBucket]:
+        target = self.target(input)
+        if target is None or kind not in self.target_rates:
+            return None
+
+        key = (kind, target)
+        bucket = self.targets.get(key)
+        if bucket is None:
+            bucket = self.targets[key] = TokenBucket(*self.target_rates[kind])
+            self.evict()
+        else:
+            self.targets.move_to_end(key)
+
+        return bucket
+
+    def evict(self) -> None:
+        # only buckets that are full again can be dropped without losing state
+        for key in list(self.targets):
+            if len(self.targets) <= self.max_targets:
+                break
+            if self.targets[key].idle:
+                del self.targets[key]
+
+    async def acquire(self, name: str, input: Optional[dict] = None) -> float:
+        kind = self.method_class(name)
+        waited = await self.bucket(kind).acquire()
+        target_bucket = self.target_bucket(kind, input)
+        if target_bucket is not None:
+            waited += await target_bucket.acquire()
+
+        if waited:
+            self.throttled_calls += 1
+            self.throttled_time += waited
+            self.throttled_time_by_class[kind] = self.throttled_time_by_class.get(kind, 0) + waited
+
+        return waited
+
+    def throttled(self, name: str, input: Optional[dict] = None, attempt: int = 0) -> None:
+        kind = self.method_class(name)
+        backoff = min(self.max_backoff, 2 ** attempt)
+        self.retries += 1
+        self.bucket(kind).penalize(backoff)
+        target_bucket = self.target_bucket(kind, input)
+        if target_bucket is not None:
+            target_bucket.penalize(backoff)
+
+    def succeeded(self, name: str, input: Optional[dict] = None) -> None:
+        kind = self.method_class(name)
+        self.bucket(kind).reward()
+        target_bucket = self.target_bucket(kind, input)
+        if target_bucket is not None:
+            target_bucket.reward()
+
+    def stats(self) -> dict:
+        return {
+            'throttled_calls': self.throttled_calls,
+            'throttled_time': self.throttled_time,
+            'throttled_time_by_class': dict(self.throttled_time_by_class),
+            'retries': self.retries,
+            'rates': {kind: bucket.rate for kind, bucket in self.buckets.items()},
+            'targets': len(self.targets),
+        }
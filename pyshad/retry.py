@@ -0,0 +1,80 @@
+import asyncio
+import random
+import time
+from typing import Iterable, Optional
+
+import aiohttp
+
+from . import exceptions
+from .singleflight import IDEMPOTENT_METHODS
+
+# methods that only read state, safe to send again after a failed attempt
+RETRYABLE_METHODS = IDEMPOTENT_METHODS | {
+    'getChatsUpdates',
+    'getMessagesUpdates',
+    'getContactsUpdates',
+    'getGroupVoiceChatUpdates',
+    'getMe',
+    'searchChatMessages',
+    'searchGlobalObjects',
+    'searchStickers',
+}
+
+# the request never reached the server, so any method can be sent again
+CONNECT_ERRORS = (aiohttp.ClientConnectorError, aiohttp.ClientProxyConnectionError)
+
+
+class RetryPolicy:
+    def __init__(self,
+                 attempts: int = 3,
+                 base_delay: float = 0.5,
+                 max_delay: float = 10,
+                 jitter: bool = True,
+                 deadline: Optional[float] = None,
+                 retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+                 methods: Optional[Iterable[str]] = None) -> None:
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.methods = set(RETRYABLE_METHODS if methods is None else methods)
+
+    def delay(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        # full jitter spreads the retries of many clients apart
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def idempotent(self, method: Optional[str]) -> bool:
+        return method is None or method in self.methods
+
+    def should_retry(self, method: Optional[str], error: BaseException, attempt: int) -> bool:
+        if attempt + 1 >= self.attempts:
+            return False
+
+        if isinstance(error, CONNECT_ERRORS) or isinstance(error.__cause__, CONNECT_ERRORS):
+            return True
+
+        if isinstance(error, exceptions.ServerUnavailable) and error.status not in self.retry_statuses:
+            return False
+
+        return self.idempotent(method)
+
+    def call_deadline(self, deadline: Optional[float] = None) -> Optional[float]:
+        if deadline is None and self.deadline is not None:
+            deadline = time.monotonic() + self.deadline
+        return deadline
+
+    @staticmethod
+    def remaining(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else deadline - time.monotonic()
+
+    async def sleep(self, attempt: int, deadline: Optional[float]) -> bool:
+        delay = self.delay(attempt)
+        remaining = self.remaining(deadline)
+        if remaining is not None and remaining <= delay:
+            return False
+
+        await asyncio.sleep(delay)
+        return True
@@ -0,0 +1,142 @@
+import asyncio
+import signal
+from typing import Iterable, List, Optional, Union
+
+from .client import Client
+from .endpoints import EndpointManager
+from .network import Network
+from .pool import ConnectionPool
+from .sessions import StringSession
+
+
+async def idle():
+    """Wait until the process gets SIGINT, SIGTERM or SIGABRT."""
+    event = asyncio.Event()
+    loop = asyncio.get_event_loop()
+    signals = [getattr(signal, name) for name in ('SIGINT', 'SIGTERM', 'SIGABRT') if hasattr(signal, name)]
+    handled, previous = [], {}
+
+    for sig in signals:
+        try:
+            loop.add_signal_handler(sig, event.set)
+            handled.append(sig)
+
+        except (NotImplementedError, RuntimeError):
+            # windows event loops have no signal handlers
+            previous[sig] = signal.signal(sig, lambda *args: loop.call_soon_threadsafe(event.set))
+
+    try:
+        await event.wait()
+
+    finally:
+        for sig in handled:
+            loop.remove_signal_handler(sig)
+
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+
+async def compose(clients: Iterable[Client], sequential: bool = False):
+    """Start every client, receive their updates on this loop until idle() returns."""
+    clients = list(clients)
+    if sequential:
+        for client in clients:
+            await client.start()
+
+    else:
+        await asyncio.gather(*(client.start() for client in clients))
+
+    tasks = [asyncio.ensure_future(client.connection.get_updates()) for client in clients]
+    try:
+        await idle()
+
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(*(client.disconnect() for client in clients), return_exceptions=True)
+
+
+class ClientPool:
+    """Many accounts on one event loop.
+
+    The clients share one connection pool and one dc discovery, every
+    account gets its own budget of requests in flight.
+
+        pool = ClientPool(concurrency=4)
+        for name in ('first', 'second'):
+            pool.add(name)
+
+        pool.run()
+    """
+
+    def __init__(self,
+                 pool: Optional[ConnectionPool] = None,
+                 endpoints: Optional[EndpointManager] = None,
+                 concurrency: Optional[int] = None,
+                 **options) -> None:
+        self.pool = pool or ConnectionPool(headers=Network.HEADERS)
+        self.endpoints = endpoints or EndpointManager(cache_path=options.get('dc_cache_path'),
+                                                      cache_ttl=options.get('dc_cache_ttl', 3600))
+        self.concurrency = concurrency
+        self.options = options
+        self.clients: List[Client] = []
+
+    def __iter__(self):
+        return iter(self.clients)
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def add(self, name: Union[str, StringSession], concurrency: Optional[int] = None, **kwargs) -> Client:
+        client = Client(name, pool=self.pool, endpoints=self.endpoints,
+                        max_concurrency=concurrency or self.concurrency,
+                        **{**self.options, **kwargs})
+        self.clients.append(client)
+        return client
+
+    async def start(self) -> None:
+        await asyncio.gather(*(client.start() for client in self.clients))
+
+    async def compose(self, sequential: bool = False) -> None:
+        try:
+            await compose(self.clients, sequential=sequential)
+
+        finally:
+            await self.close()
+
+    def run(self, sequential: bool = False) -> None:
+        asyncio.run(self.compose(sequential=sequential))
+
+    async def close(self) -> None:
+        for client in self.clients:
+            if hasattr(client, 'connection'):
+                await client.disconnect()
+
+        await self.endpoints.close()
+        await self.pool.close()
+
+    @staticmethod
+    def client_stats(client: Client) -> dict:
+        connection = getattr(client, 'connection', None)
+        return {
+            'name': client.name if isinstance(client.name, str) else None,
+            'guid': client.guid,
+            'in_flight': client.in_flight,
+            'transport': connection.transport if connection is not None else None,
+            'reconnects': connection.reconnects if connection is not None else 0,
+            'rate_limiter': client.rate_limiter.stats() if client.rate_limiter is not None else None,
+            'cache': client.cache.stats() if client.cache is not None else None,
+            'dedup': client.dedup.stats() if client.dedup is not None else None,
+        }
+
+    def stats(self) -> dict:
+        clients = [self.client_stats(client) for client in self.clients]
+        totals = {'clients': len(clients), 'reconnects': sum(item['reconnects'] for item in clients)}
+        for key, fields in (('rate_limiter', ('throttled_calls', 'throttled_time', 'retries')),
+                            ('cache', ('hits', 'misses')), ('dedup', ('hits', 'misses'))):
+            for field in fields:
+                totals[f'{key}_{field}'] = sum(item[key][field] for item in clients if item[key])
+
+        return {'pool': self.pool.stats(), 'totals': totals, 'clients': clients}
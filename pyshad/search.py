@@ -0,0 +1,138 @@
+import sqlite3
+import threading
+from typing import Any, Iterable, List, Optional
+
+from .export import to_dict
+from .types import Results
+
+
+class SearchIndex:
+    """Full text index of messages on sqlite fts5.
+
+    Queries use the fts5 syntax: ``hello wor*`` matches a prefix,
+    ``"hello world"`` a phrase, terms are combined with AND/OR/NOT.
+    """
+
+    def __init__(self, path: str) -> None:
+        if not path.endswith('.search'):
+            path += '.search'
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('pragma journal_mode = wal')
+        try:
+            self._connection.executescript('''
+                create table if not exists docs (id integer primary key, object_guid text,
+                    message_id integer, time integer, author_guid text, text text);
+                create unique index if not exists docs_message on docs (object_guid, message_id);
+                create index if not exists docs_time on docs (time);
+                create virtual table if not exists fts using fts5(text, content='docs',
+                    content_rowid='id', tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3');
+            ''')
+
+        except sqlite3.OperationalError as exc:
+            self._connection.close()
+            raise RuntimeError('the sqlite3 module of this python is built without fts5') from exc
+
+    @staticmethod
+    def quote(text: str) -> str:
+        """Turn text into a phrase query."""
+        return '"{}"'.format(text.replace('"', '""'))
+
+    def _remove(self, object_guid: str, message_id: int) -> None:
+        row = self._connection.execute('select id, text from docs where object_guid = ? and message_id = ?',
+                                       (object_guid, message_id)).fetchone()
+        if row is not None:
+            self._connection.execute("insert into fts (fts, rowid, text) values ('delete', ?, ?)", row)
+            self._connection.execute('delete from docs where id = ?', (row[0],))
+
+    def add_messages(self, object_guid: str, messages: Iterable[Any]) -> int:
+        count = 0
+        with self._lock, self._connection:
+            for message in map(to_dict, messages):
+                if not message or not message.get('message_id') or not message.get('text'):
+                    continue
+
+                message_id = int(message['message_id'])
+                self._remove(object_guid, message_id)
+                cursor = self._connection.execute(
+                    'insert into docs (object_guid, message_id, time, author_guid, text)'
+                    ' values (?, ?, ?, ?, ?)',
+                    (object_guid, message_id, int(message.get('time') or 0),
+                     message.get('author_object_guid'), message['text']))
+                self._connection.execute('insert into fts (rowid, text) values (?, ?)',
+                                         (cursor.lastrowid, message['text']))
+                count += 1
+
+        return count
+
+    def delete_messages(self, object_guid: str, message_ids: Iterable[Any]) -> None:
+        with self._lock, self._connection:
+            for message_id in message_ids:
+                self._remove(object_guid, int(message_id))
+
+    def apply(self, updates: Iterable[Any]) -> int:
+        """Index getMessagesUpdates entries or websocket message_updates."""
+        changed = 0
+        for update in map(to_dict, updates):
+            object_guid = update.get('object_guid')
+            if not object_guid or not update.get('message_id'):
+                continue
+
+            if update.get('action') == 'Delete':
+                self.delete_messages(object_guid, [update['message_id']])
+                changed += 1
+
+            elif isinstance(update.get('message'), dict):
+                changed += self.add_messages(object_guid, [update['message']])
+
+        return changed
+
+    def search(self,
+               query: str,
+               object_guids: Optional[Iterable[str]] = None,
+               author_guid: Optional[str] = None,
+               since: Optional[int] = None,
+               until: Optional[int] = None,
+               limit: int = 50,
+               order: str = 'rank') -> List[Results]:
+        """Messages matching query, best match first or newest first with order='time'."""
+        where, params = ['fts match ?'], [query]
+        if object_guids is not None:
+            object_guids = list(object_guids)
+            where.append('docs.object_guid in ({})'.format(', '.join('?' * len(object_guids))))
+            params.extend(object_guids)
+
+        for clause, value in (('docs.author_guid = ?', author_guid),
+                              ('docs.time >= ?', since), ('docs.time <= ?', until)):
+            if value is not None:
+                where.append(clause)
+                params.append(value)
+
+        if order not in ('rank', 'time'):
+            raise ValueError('The `order` argument can only be in `("rank", "time")`.')
+
+        params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(
+                'select docs.object_guid, docs.message_id, docs.time, docs.author_guid, docs.text'
+                ' from fts join docs on docs.id = fts.rowid where ' + ' and '.join(where) +
+                (' order by rank' if order == 'rank' else ' order by docs.time desc') + ' limit ?',
+                params).fetchall()
+
+        return [Results({'object_guid': object_guid, 'message_id': str(message_id), 'time': str(time),
+                         'author_object_guid': author_guid, 'text': text})
+                for object_guid, message_id, time, author_guid, text in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection.execute('select count(*) from docs').fetchone()[0]
+
+    def optimize(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("insert into fts (fts) values ('optimize')")
+
+    def close(self) -> None:
+        self._connection.close()
@@ -1,2 +1,4 @@
 from .sqliteSession import SQLiteSession
-from .stringSession import StringSession
\ No newline at end of file
+from .stringSession import StringSession
+from .asyncSqliteSession import AsyncSQLiteSession
+from .storageSession import StorageSession
\ No newline at end of file
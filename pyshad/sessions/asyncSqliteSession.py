@@ -0,0 +1,203 @@
+import asyncio
+import json
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, List, Optional, Sequence
+
+from .sqliteSession import SQLiteSession
+
+
+class AsyncSQLiteSession(SQLiteSession):
+    """SQLiteSession in wal mode that keeps the event loop free.
+
+    Writes are queued to one writer thread that commits them in batches,
+    reads run on a small pool of read connections. The file is a regular
+    ``.rp`` session, older sessions are upgraded with upgrade_database.
+    """
+
+    def __init__(self,
+                 session: str,
+                 readers: int = 4,
+                 batch_size: int = 256,
+                 flush_interval: float = 0.005) -> None:
+        super().__init__(session)
+        self._connection.execute('pragma journal_mode = wal')
+        self._connection.commit()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.commits = 0
+        self.writes = 0
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._stopped = False
+        self._stop_lock = threading.Lock()
+        self._local = threading.local()
+        self._readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix='pyshad-session-read')
+        self._writer = threading.Thread(target=self._write_loop, name='pyshad-session-write', daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 keeps the prepared statements of every connection in a cache
+        connection = sqlite3.connect(self.filename, check_same_thread=False, cached_statements=256)
+        connection.execute('pragma synchronous = normal')
+        return connection
+
+    def _reader(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+            connection.execute('pragma query_only = on')
+        return connection
+
+    def _write_loop(self) -> None:
+        batch = []
+        error: BaseException = sqlite3.ProgrammingError('the session writer is stopped')
+        connection = None
+        try:
+            connection = self._connect()
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+
+                batch = [item]
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+
+                    if item is None:
+                        self._queue.put(None)
+                        break
+
+                    batch.append(item)
+
+                self._commit(connection, batch)
+                batch = []
+
+        except BaseException as exc:
+            error = exc
+            raise
+
+        finally:
+            # nothing would ever answer the writes still queued, fail them instead
+            with self._stop_lock:
+                self._stopped = True
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    batch.append(item)
+
+            for item in batch:
+                if not item[3].done():
+                    item[3].set_exception(error)
+
+            if connection is not None:
+                connection.close()
+
+    def _commit(self, connection: sqlite3.Connection, batch: list) -> None:
+        try:
+            with connection:
+                results = [self._execute(connection, *item[:3]) for item in batch]
+
+        except Exception:
+            # one bad statement must not fail the others of its batch, this also
+            # covers values sqlite3 can not bind, like an int over 64 bits
+            for item in batch:
+                try:
+                    with connection:
+                        result = self._execute(connection, *item[:3])
+
+                except Exception as exc:
+                    item[3].set_exception(exc)
+
+                else:
+                    self.writes += 1
+                    item[3].set_result(result)
+
+                self.commits += 1
+            return
+
+        self.commits += 1
+        self.writes += len(batch)
+        for item, result in zip(batch, results):
+            item[3].set_result(result)
+
+    @staticmethod
+    def _execute(connection: sqlite3.Connection, sql: str, parameters: Any, many: bool) -> int:
+        if many:
+            return connection.executemany(sql, parameters).rowcount
+        return connection.execute(sql, parameters).rowcount
+
+    def submit(self, sql: str, parameters: Any = (), many: bool = False) -> Future:
+        future = Future()
+        with self._stop_lock:
+            if self._stopped:
+                future.set_exception(sqlite3.ProgrammingError('the session writer is stopped'))
+            else:
+                self._queue.put((sql, parameters, many, future))
+        return future
+
+    async def execute(self, sql: str, parameters: Sequence = ()) -> int:
+        return await asyncio.wrap_future(self.submit(sql, parameters))
+
+    async def executemany(self, sql: str, parameters: Iterable[Sequence]) -> int:
+        return await asyncio.wrap_future(self.submit(sql, list(parameters), many=True))
+
+    def _fetch(self, sql: str, parameters: Sequence, one: bool):
+        cursor = self._reader().execute(sql, parameters)
+        try:
+            return cursor.fetchone() if one else cursor.fetchall()
+        finally:
+            cursor.close()
+
+    async def fetchone(self, sql: str, parameters: Sequence = ()) -> Optional[tuple]:
+        return await asyncio.get_event_loop().run_in_executor(self._readers, self._fetch, sql, parameters, True)
+
+    async def fetchall(self, sql: str, parameters: Sequence = ()) -> List[tuple]:
+        return await asyncio.get_event_loop().run_in_executor(self._readers, self._fetch, sql, parameters, False)
+
+    def information(self):
+        return self._fetch('select * from session', (), True)
+
+    def insert(self, phone_number, auth, guid, user_agent, private_key, *args, **kwargs):
+        # callers read the session right after saving it, so wait for the commit
+        self.submit('insert or replace into session (phone, auth, guid, agent, private_key)'
+                    ' values (?, ?, ?, ?, ?)',
+                    (phone_number, auth, guid, user_agent, private_key)).result()
+
+    def dcs(self):
+        result = self._fetch('select data, time from dcs where id = 1', (), True)
+        if result is not None:
+            return json.loads(result[0]), result[1]
+
+    def insert_dcs(self, data: dict):
+        self.submit('insert or replace into dcs (id, data, time) values (1, ?, ?)',
+                    (json.dumps(data), time.time()))
+
+    async def ainformation(self):
+        return await self.fetchone('select * from session')
+
+    async def adcs(self):
+        result = await self.fetchone('select data, time from dcs where id = 1')
+        if result is not None:
+            return json.loads(result[0]), result[1]
+
+    async def ainsert(self, phone_number, auth, guid, user_agent, private_key, *args, **kwargs):
+        await self.execute('insert or replace into session (phone, auth, guid, agent, private_key)'
+                           ' values (?, ?, ?, ?, ?)', (phone_number, auth, guid, user_agent, private_key))
+
+    def close(self) -> None:
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+        self._readers.shutdown()
+        self._connection.close()
@@ -1,8 +1,10 @@
 # import os
+import json
 import sqlite3
+import time
 
 suffix = '.rp'
-rbs_version = 1
+rbs_version = 2
 
 
 class SQLiteSession(object):
@@ -29,11 +31,22 @@ class SQLiteSession(object):
             cursor.execute('insert into version values (?)', (rbs_version,))
             cursor.execute('create table session (phone text primary key'
                            ', auth text, guid text, agent text, private_key text)')
+            self.create_dcs_table(cursor)
             self._connection.commit()
         cursor.close()
 
+    def create_dcs_table(self, cursor):
+        cursor.execute('create table if not exists dcs (id integer primary key'
+                       ', data text, time real)')
+
     def upgrade_database(self, version):
-        pass
+        cursor = self._connection.cursor()
+        if version < 2:
+            self.create_dcs_table(cursor)
+
+        cursor.execute('update version set version = ?', (rbs_version,))
+        self._connection.commit()
+        cursor.close()
 
     def information(self):
         cursor = self._connection.cursor()
@@ -52,6 +65,21 @@ class SQLiteSession(object):
         self._connection.commit()
         cursor.close()
 
+    def dcs(self):
+        cursor = self._connection.cursor()
+        cursor.execute('select data, time from dcs where id = 1')
+        result = cursor.fetchone()
+        cursor.close()
+        if result is not None:
+            return json.loads(result[0]), result[1]
+
+    def insert_dcs(self, data: dict):
+        cursor = self._connection.cursor()
+        cursor.execute('insert or replace into dcs (id, data, time) values (1, ?, ?)',
+                       (json.dumps(data), time.time()))
+        self._connection.commit()
+        cursor.close()
+
     @classmethod
     def from_string(cls, session, file_name=None):
         info = session.information()
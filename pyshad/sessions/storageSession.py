@@ -0,0 +1,95 @@
+import asyncio
+import time
+from typing import Any, Optional
+
+from ..storage import Storage
+
+
+class StorageSession:
+    """Session kept in a Storage, so any process can pick up an account.
+
+    The session row is loaded once by open(), the sync methods the client
+    calls read that copy and only schedule the write to the storage, so
+    ``await session.flush()`` is needed before shutdown. A failed write is
+    kept and raised by the next flush().
+
+        session = await StorageSession.open(RedisStorage(), 'account-1')
+        client = Client(session)
+        ...
+        await session.flush()
+    """
+
+    def __init__(self, storage: Storage, name: str, information: Optional[list] = None,
+                 dcs: Optional[list] = None) -> None:
+        self.storage = storage
+        self.name = name
+        self.session = information
+        self.dcs_cache = tuple(dcs) if dcs else None
+        self.error: Optional[BaseException] = None
+        self._pending = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def open(cls, storage: Storage, name: str) -> "StorageSession":
+        data = await storage.get_many([f'session:{name}', f'dcs:{name}'])
+        return cls(storage, name, data.get(f'session:{name}'), data.get(f'dcs:{name}'))
+
+    def _save(self, key: str, value: Any) -> None:
+        self._pending[key] = value
+        try:
+            loop = asyncio.get_running_loop()
+
+        except RuntimeError:
+            # no loop to write from, the next flush() writes it
+            return
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._write())
+
+    async def _write(self) -> None:
+        try:
+            await self._flush()
+
+        except Exception as exc:
+            # the values stay pending, flush() retries them and raises if that fails too
+            self.error = exc
+
+    async def _flush(self) -> None:
+        while self._pending:
+            items, self._pending = self._pending, {}
+            try:
+                await self.storage.set_many(items)
+
+            except BaseException:
+                # a value saved meanwhile is newer than the one that failed
+                self._pending = {**items, **self._pending}
+                raise
+
+    def insert(self, phone_number, auth, guid, user_agent, private_key=None, *args, **kwargs):
+        self.session = [phone_number, auth, guid, user_agent, private_key]
+        self._save(f'session:{self.name}', self.session)
+
+    async def ainsert(self, *args, **kwargs):
+        # like insert, but returns once the row is in the storage
+        self.insert(*args, **kwargs)
+        await self.flush()
+
+    def information(self):
+        return self.session
+
+    async def ainformation(self):
+        return self.session
+
+    def dcs(self):
+        return self.dcs_cache
+
+    def insert_dcs(self, data: dict):
+        self.dcs_cache = (data, time.time())
+        self._save(f'dcs:{self.name}', list(self.dcs_cache))
+
+    async def flush(self) -> None:
+        if self._task is not None and not self._task.done():
+            await asyncio.wait({self._task})
+
+        await self._flush()
+        self.error = None
@@ -1,10 +1,12 @@
 import json
+import time
 import base64
 
 
 class StringSession(object):
     def __init__(self, session: str = None) -> None:
         self.session = self.load(session)
+        self.dcs_cache = None
 
     @classmethod
     def load(cls, session):
@@ -28,6 +30,12 @@ class StringSession(object):
     def information(self):
         return self.session
 
+    def dcs(self):
+        return self.dcs_cache
+
+    def insert_dcs(self, data: dict):
+        self.dcs_cache = (data, time.time())
+
     def save(self, file_name=None):
         result = self.dump(self.session)
         if result is None:
@@ -0,0 +1,65 @@
+import asyncio
+import json
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Optional
+
+# read-only api methods, concurrent identical calls of them can share one request
+IDEMPOTENT_METHODS = frozenset({
+    'getUserInfo',
+    'getGroupInfo',
+    'getChannelInfo',
+    'getObjectByUsername',
+    'getAbsObjects',
+    'getChats',
+    'getContacts',
+    'getGroupAllMembers',
+    'getChannelAllMembers',
+    'getGroupAdminMembers',
+    'getChannelAdminMembers',
+    'getBannedGroupMembers',
+    'getGroupDefaultAccess',
+    'getGroupLink',
+    'getChannelLink',
+    'getMessagesByID',
+    'getMessagesInterval',
+    'getAvatars',
+    'getMySessions',
+    'getFolders',
+    'getPrivacySetting',
+    'getBlockedUsers',
+    'getMyStickerSets',
+    'getStickerSetByID',
+    'getStickersByEmoji',
+    'GetStickersBySetIDs',
+    'getTrendStickerSets',
+    'getMyGifSet',
+    'getPollStatus',
+    'checkUserUsername',
+    'checkChannelUsername',
+})
+
+
+class SingleFlight:
+    def __init__(self, methods: Optional[Iterable[str]] = None) -> None:
+        self.methods = set(IDEMPOTENT_METHODS if methods is None else methods)
+        self.calls: Dict[Hashable, asyncio.Future] = {}
+        self.shared = 0
+
+    @staticmethod
+    def key(name: str, input: Optional[dict], *args) -> Hashable:
+        return (name, json.dumps(input, sort_keys=True, default=str), *args)
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable]):
+        future = self.calls.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(function())
+            self.calls[key] = future
+            future.add_done_callback(lambda _: self.calls.pop(key, None))
+            # retrieve the exception even if every caller was cancelled
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        else:
+            self.shared += 1
+
+        # one cancelled caller must not cancel the request of the others
+        return await asyncio.shield(future)
@@ -0,0 +1,255 @@
+import asyncio
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+class Storage:
+    """Key value store shared by clients, values are anything json can encode.
+
+    Backends implement get_many, set_many and delete, a ttl in seconds makes
+    a key expire.
+    """
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        return (await self.get_many([key])).get(key, default)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self.set_many({key: value}, ttl=ttl)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    async def set_many(self, items: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryStorage(Storage):
+    def __init__(self) -> None:
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}
+
+    def _get(self, key: str) -> Tuple[bool, Any]:
+        item = self._data.get(key)
+        if item is None:
+            return False, None
+
+        value, expires = item
+        if expires is not None and expires < time.monotonic():
+            del self._data[key]
+            return False, None
+
+        return True, value
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        result = {}
+        for key in keys:
+            found, value = self._get(key)
+            if found:
+                result[key] = json.loads(value)
+        return result
+
+    async def set_many(self, items: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        for key, value in items.items():
+            # stored encoded, so callers never share mutable values with the store
+            self._data[key] = (json.dumps(value, default=str), expires)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+
+class SQLiteStorage(Storage):
+    def __init__(self, path: str) -> None:
+        self.path = path
+        # one thread owns the connection, so calls never block the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pyshad-storage')
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('pragma journal_mode = wal')
+        self._connection.execute('create table if not exists storage (key text primary key'
+                                 ', value text, expires real)')
+        self._connection.commit()
+
+    async def _run(self, function, *args):
+        return await asyncio.get_event_loop().run_in_executor(self._executor, function, *args)
+
+    def _get_many(self, keys: List[str]) -> Dict[str, Any]:
+        result, now = {}, time.time()
+        # sqlite limits the number of variables of one statement
+        for index in range(0, len(keys), 500):
+            chunk = keys[index:index + 500]
+            rows = self._connection.execute('select key, value, expires from storage where key in'
+                                            ' ({})'.format(', '.join('?' * len(chunk))), chunk)
+            for key, value, expires in rows:
+                if expires is None or expires >= now:
+                    result[key] = json.loads(value)
+        return result
+
+    def _set_many(self, items: Mapping[str, Any], ttl: Optional[float]) -> None:
+        expires = None if ttl is None else time.time() + ttl
+        with self._connection:
+            self._connection.executemany('insert or replace into storage (key, value, expires)'
+                                         ' values (?, ?, ?)',
+                                         [(key, json.dumps(value, default=str), expires)
+                                          for key, value in items.items()])
+
+    def _delete(self, keys: Tuple[str, ...]) -> None:
+        with self._connection:
+            self._connection.executemany('delete from storage where key = ?', [(key,) for key in keys])
+
+    def _purge(self) -> None:
+        with self._connection:
+            self._connection.execute('delete from storage where expires < ?', (time.time(),))
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        return await self._run(self._get_many, list(keys))
+
+    async def set_many(self, items: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        await self._run(self._set_many, dict(items), ttl)
+
+    async def delete(self, *keys: str) -> None:
+        await self._run(self._delete, keys)
+
+    async def purge(self) -> None:
+        await self._run(self._purge)
+
+    async def close(self) -> None:
+        await self._run(self._connection.close)
+        self._executor.shutdown()
+
+
+class RedisError(Exception):
+    pass
+
+
+class RedisStorage(Storage):
+    """Storage on a redis compatible server, spoken to over resp without extra packages.
+
+    Commands of one batch are pipelined, they share a single round trip.
+    """
+
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 6379,
+                 db: int = 0,
+                 password: Optional[str] = None,
+                 prefix: str = 'pyshad:') -> None:
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.prefix = prefix
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @staticmethod
+    def encode(*args) -> bytes:
+        parts = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode('utf-8')
+            parts.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+        return b''.join(parts)
+
+    async def read_reply(self) -> Any:
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError('the storage server closed the connection')
+
+        kind, data = line[:1], line[1:-2]
+        if kind == b'+':
+            return data.decode('utf-8')
+        if kind == b'-':
+            return RedisError(data.decode('utf-8'))
+        if kind == b':':
+            return int(data)
+        if kind == b'$':
+            length = int(data)
+            if length < 0:
+                return None
+            return (await self._reader.readexactly(length + 2))[:-2]
+        if kind == b'*':
+            length = int(data)
+            return None if length < 0 else [await self.read_reply() for _ in range(length)]
+
+        raise RedisError(f'unexpected reply {line!r}')
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        commands = []
+        if self.password:
+            commands.append(('AUTH', self.password))
+        if self.db:
+            commands.append(('SELECT', self.db))
+        if commands:
+            await self._pipeline(commands)
+
+    async def _pipeline(self, commands: List[tuple]) -> list:
+        self._writer.write(b''.join(self.encode(*command) for command in commands))
+        await self._writer.drain()
+        replies = [await self.read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    async def execute(self, *commands: tuple) -> list:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            try:
+                if self._writer is None or self._writer.is_closing():
+                    await self.connect()
+
+                return await self._pipeline(list(commands))
+
+            except RedisError:
+                # every reply was read, the connection is still in step
+                raise
+
+            except BaseException:
+                # replies left unread, e.g. after a cancellation, would answer the
+                # next command, so the connection is dropped and reopened next call
+                if self._writer is not None:
+                    self._writer.close()
+                    self._writer = None
+                raise
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        values, = await self.execute(('MGET', *(self.prefix + key for key in keys)))
+        return {key: json.loads(value) for key, value in zip(keys, values) if value is not None}
+
+    async def set_many(self, items: Mapping[str, Any], ttl: Optional[float] = None) -> None:
+        if not items:
+            return
+
+        expiry = () if ttl is None else ('PX', max(1, int(ttl * 1000)))
+        await self.execute(*(('SET', self.prefix + key, json.dumps(value, default=str), *expiry)
+                             for key, value in items.items()))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.execute(('DEL', *(self.prefix + key for key in keys)))
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
@@ -0,0 +1,140 @@
+import json
+import sqlite3
+import threading
+from typing import Any, Iterable, List, Optional
+
+from .export import to_dict
+from .types import Results
+
+# state key of the chat list itself, chats use their object_guid
+CHATS_STATE = ''
+
+
+class MessageStore:
+    def __init__(self, path: str) -> None:
+        if not path.endswith('.messages'):
+            path += '.messages'
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('pragma journal_mode = wal')
+        self._connection.execute('create table if not exists states (object_guid text primary key'
+                                 ', state integer)')
+        self._connection.execute('create table if not exists messages (object_guid text'
+                                 ', message_id integer, time integer, author_guid text, type text'
+                                 ', text text, data text, primary key (object_guid, message_id))')
+        self._connection.execute('create index if not exists messages_time'
+                                 ' on messages (object_guid, time)')
+        self._connection.execute('create index if not exists messages_author'
+                                 ' on messages (author_guid, time)')
+        self._connection.commit()
+
+    @staticmethod
+    def row(object_guid: str, message: dict) -> tuple:
+        return (object_guid, int(message['message_id']), int(message.get('time') or 0),
+                message.get('author_object_guid'), message.get('type'), message.get('text'),
+                json.dumps(message, ensure_ascii=False, default=str))
+
+    def state(self, object_guid: str = CHATS_STATE) -> Optional[int]:
+        with self._lock:
+            row = self._connection.execute('select state from states where object_guid = ?',
+                                           (object_guid,)).fetchone()
+        return None if row is None else row[0]
+
+    def set_state(self, object_guid: str, state: Any) -> None:
+        if state is None:
+            return
+
+        with self._lock, self._connection:
+            self._connection.execute('insert or replace into states (object_guid, state) values (?, ?)',
+                                     (object_guid, int(state)))
+
+    def add_messages(self, object_guid: str, messages: Iterable[Any]) -> int:
+        rows = [self.row(object_guid, message) for message in map(to_dict, messages)
+                if message and message.get('message_id')]
+        with self._lock, self._connection:
+            self._connection.executemany('insert or replace into messages (object_guid, message_id'
+                                         ', time, author_guid, type, text, data)'
+                                         ' values (?, ?, ?, ?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def delete_messages(self, object_guid: str, message_ids: Iterable[Any]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany('delete from messages where object_guid = ? and message_id = ?',
+                                         [(object_guid, int(message_id)) for message_id in message_ids])
+
+    def apply(self, updates: Iterable[Any]) -> int:
+        """Apply getMessagesUpdates entries or websocket message_updates."""
+        changed = 0
+        for update in map(to_dict, updates):
+            object_guid = update.get('object_guid')
+            if not object_guid or not update.get('message_id'):
+                continue
+
+            if update.get('action') == 'Delete':
+                self.delete_messages(object_guid, [update['message_id']])
+
+            elif isinstance(update.get('message'), dict):
+                self.add_messages(object_guid, [update['message']])
+
+            else:
+                continue
+
+            changed += 1
+
+        return changed
+
+    def get(self, object_guid: str, message_id: Any) -> Optional[Results]:
+        with self._lock:
+            row = self._connection.execute('select data from messages where object_guid = ?'
+                                           ' and message_id = ?', (object_guid, int(message_id))).fetchone()
+        return None if row is None else Results(json.loads(row[0]))
+
+    def messages(self,
+                 object_guid: Optional[str] = None,
+                 author_guid: Optional[str] = None,
+                 since: Optional[int] = None,
+                 until: Optional[int] = None,
+                 limit: Optional[int] = 100,
+                 reverse: bool = True) -> List[Results]:
+        """Stored messages, newest first unless reverse is False.
+
+        since and until are unix times, both inclusive.
+        """
+        where, params = [], []
+        for clause, value in (('object_guid = ?', object_guid), ('author_guid = ?', author_guid),
+                              ('time >= ?', since), ('time <= ?', until)):
+            if value is not None:
+                where.append(clause)
+                params.append(value)
+
+        query = 'select data from messages'
+        if where:
+            query += ' where ' + ' and '.join(where)
+
+        query += ' order by time {0}, message_id {0}'.format('desc' if reverse else 'asc')
+        if limit is not None:
+            query += ' limit ?'
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [Results(json.loads(row[0])) for row in rows]
+
+    def count(self, object_guid: Optional[str] = None) -> int:
+        with self._lock:
+            if object_guid is None:
+                return self._connection.execute('select count(*) from messages').fetchone()[0]
+
+            return self._connection.execute('select count(*) from messages where object_guid = ?',
+                                            (object_guid,)).fetchone()[0]
+
+    def chats(self) -> List[str]:
+        with self._lock:
+            rows = self._connection.execute('select object_guid from states'
+                                            ' where object_guid != ?', (CHATS_STATE,)).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        self._connection.close()
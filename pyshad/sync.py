@@ -21,8 +21,9 @@ import functools
 import inspect
 import threading
 
-from rubpy import types
-from rubpy.methods import Methods
+from . import types
+from . import runner as runner_module
+from .methods import Methods
 
 
 def async_to_sync(obj, name):
@@ -107,9 +108,9 @@ for class_name in dir(types):
     if inspect.isclass(cls):
         wrap(cls)
 
-# # Special case for idle and compose, because they are not inside Methods
-# async_to_sync(idle_module, "idle")
-# idle = getattr(idle_module, "idle")
+# Special case for idle and compose, because they are not inside Methods
+async_to_sync(runner_module, "idle")
+idle = getattr(runner_module, "idle")
 
-# async_to_sync(compose_module, "compose")
-# compose = getattr(compose_module, "compose")
\ No newline at end of file
+async_to_sync(runner_module, "compose")
+compose = getattr(runner_module, "compose")
\ No newline at end of file
@@ -0,0 +1,202 @@
+import asyncio
+import multiprocessing
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .runner import ClientPool, idle
+
+
+def shard(accounts: Sequence[Any], workers: int) -> List[list]:
+    return [list(accounts[index::workers]) for index in range(workers)]
+
+
+def worker_main(index: int, accounts: list, options: dict, connection, metrics_interval: float) -> None:
+    asyncio.run(run_worker(index, accounts, options, connection, metrics_interval))
+
+
+async def run_worker(index: int, accounts: list, options: dict, connection, metrics_interval: float) -> None:
+    """Body of a worker process, it owns accounts and forwards their decrypted updates."""
+    pool = ClientPool(**options)
+    forwarded = {'updates': 0}
+
+    def listener(account):
+        def forward(name, package, user_guid):
+            forwarded['updates'] += len(package)
+            connection.send(('update', index, account, name, package))
+        return forward
+
+    for account in accounts:
+        name, kwargs = (account, {}) if isinstance(account, str) else (account['name'], account)
+        client = pool.add(**{**kwargs, 'name': name})
+        client.update_listeners.append(listener(name))
+
+    async def report():
+        while True:
+            await asyncio.sleep(metrics_interval)
+            connection.send(('metrics', index, {**pool.stats(), 'forwarded': forwarded['updates']}))
+
+    reporter = asyncio.ensure_future(report())
+    try:
+        await pool.compose()
+
+    finally:
+        reporter.cancel()
+        connection.close()
+
+
+class Worker:
+    def __init__(self, index: int, accounts: list) -> None:
+        self.index = index
+        self.accounts = accounts
+        self.process: Optional[multiprocessing.Process] = None
+        self.connection = None
+        self.restarts = 0
+        self.updates = 0
+        self.started_at = 0.0
+        self.metrics: Optional[dict] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+
+class ProcessRunner:
+    """Spread accounts over worker processes, each with its own event loop.
+
+    Workers do the socket, crypto and json work of their accounts and send
+    the decrypted updates to this process over a pipe (a unix socket pair),
+    where on_update(account, name, package) is called. Dead workers are
+    started again after restart_delay seconds.
+
+        runner = ProcessRunner(['first', 'second', 'third'], workers=2, on_update=print)
+        runner.run()
+    """
+
+    def __init__(self,
+                 accounts: Sequence[Any],
+                 workers: Optional[int] = None,
+                 on_update: Optional[Callable] = None,
+                 metrics_interval: float = 5,
+                 restart_delay: float = 1,
+                 max_restarts: Optional[int] = None,
+                 start_method: str = 'spawn',
+                 **options) -> None:
+        workers = max(1, min(workers or multiprocessing.cpu_count(), len(accounts) or 1))
+        self.workers = [Worker(index, accounts) for index, accounts in enumerate(shard(accounts, workers))]
+        self.on_update = on_update
+        self.metrics_interval = metrics_interval
+        self.restart_delay = restart_delay
+        self.max_restarts = max_restarts
+        self.options = options
+        self.context = multiprocessing.get_context(start_method)
+        self._stopping = False
+
+    def start_worker(self, worker: Worker) -> None:
+        loop = asyncio.get_event_loop()
+        parent, child = self.context.Pipe(duplex=False)
+        worker.process = self.context.Process(target=worker_main, daemon=True,
+                                              args=(worker.index, worker.accounts, self.options,
+                                                    child, self.metrics_interval))
+        worker.process.start()
+        child.close()
+        worker.connection = parent
+        worker.started_at = time.monotonic()
+        loop.add_reader(parent.fileno(), self.receive, worker)
+
+    def receive(self, worker: Worker) -> None:
+        connection = worker.connection
+        try:
+            while connection.poll():
+                message = connection.recv()
+                if message[0] == 'update':
+                    _, _, account, name, package = message
+                    worker.updates += len(package)
+                    if self.on_update is not None:
+                        result = self.on_update(account, name, package)
+                        if asyncio.iscoroutine(result):
+                            asyncio.ensure_future(result)
+
+                elif message[0] == 'metrics':
+                    worker.metrics = message[2]
+
+        except (EOFError, OSError):
+            asyncio.get_event_loop().remove_reader(connection.fileno())
+            connection.close()
+
+    async def supervise(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(0.5)
+            for worker in self.workers:
+                if worker.alive or self._stopping:
+                    continue
+
+                if self.max_restarts is not None and worker.restarts >= self.max_restarts:
+                    continue
+
+                if not worker.connection.closed:
+                    asyncio.get_event_loop().remove_reader(worker.connection.fileno())
+                    worker.connection.close()
+
+                # a worker that keeps dying right after start waits longer each time
+                quick = time.monotonic() - worker.started_at < 10 * self.restart_delay
+                await asyncio.sleep(self.restart_delay * (2 ** min(worker.restarts, 5) if quick else 1))
+                worker.restarts += 1
+                self.start_worker(worker)
+
+    async def start(self) -> None:
+        self._stopping = False
+        for worker in self.workers:
+            self.start_worker(worker)
+
+    async def stop(self, timeout: float = 5) -> None:
+        self._stopping = True
+        for worker in self.workers:
+            if worker.alive:
+                worker.process.terminate()
+
+        for worker in self.workers:
+            if worker.process is not None:
+                await asyncio.get_event_loop().run_in_executor(None, worker.process.join, timeout)
+                if worker.process.is_alive():
+                    worker.process.kill()
+
+            if worker.connection is not None and not worker.connection.closed:
+                asyncio.get_event_loop().remove_reader(worker.connection.fileno())
+                worker.connection.close()
+
+    async def compose(self) -> None:
+        await self.start()
+        supervisor = asyncio.ensure_future(self.supervise())
+        try:
+            await idle()
+
+        finally:
+            supervisor.cancel()
+            await self.stop()
+
+    def run(self) -> None:
+        asyncio.run(self.compose())
+
+    def stats(self) -> dict:
+        workers = [{
+            'index': worker.index,
+            'pid': worker.process.pid if worker.process is not None else None,
+            'alive': worker.alive,
+            'accounts': len(worker.accounts),
+            'restarts': worker.restarts,
+            'updates': worker.updates,
+            'metrics': worker.metrics,
+        } for worker in self.workers]
+
+        totals: Dict[str, Any] = {
+            'workers': len(workers),
+            'alive': sum(item['alive'] for item in workers),
+            'restarts': sum(item['restarts'] for item in workers),
+            'updates': sum(item['updates'] for item in workers),
+        }
+        for item in workers:
+            for key, value in ((item['metrics'] or {}).get('totals') or {}).items():
+                if key != 'clients':
+                    totals[key] = totals.get(key, 0) + value
+
+        return {'totals': totals, 'workers': workers}